@@ -1,32 +1,46 @@
 from __future__ import annotations
 
 import os
+from functools import lru_cache
 from typing import Sequence
 
 from google.auth.credentials import Credentials
 from google.oauth2.service_account import Credentials as ServiceAccountCredentials
 
+# (scopes, service-account file, impersonated subject)
+CredentialsKey = tuple[tuple[str, ...], str, str | None]
 
-def _service_account_credentials(scopes: Sequence[str]) -> Credentials:
-    creds_path = os.getenv("GOOGLE_SERVICE_ACCOUNT_FILE") or os.getenv(
-        "GOOGLE_APPLICATION_CREDENTIALS"
-    )
-    if not creds_path:
-        raise RuntimeError(
-            "Service account auth is required. Set GOOGLE_SERVICE_ACCOUNT_FILE "
-            "(or GOOGLE_APPLICATION_CREDENTIALS) to your service account JSON path."
-        )
 
+@lru_cache(maxsize=8)
+def _service_account_credentials(
+    scopes: tuple[str, ...],
+    creds_path: str,
+    subject: str | None,
+) -> Credentials:
     creds: Credentials = ServiceAccountCredentials.from_service_account_file(
         creds_path, scopes=list(scopes)
     )
 
-    subject = os.getenv("GOOGLE_IMPERSONATE_USER")
     if subject and hasattr(creds, "with_subject"):
         creds = creds.with_subject(subject)
 
     return creds
 
 
+def credentials_key(scopes: Sequence[str]) -> CredentialsKey:
+    # Resolved on every call, so cached clients follow credential changes.
+    creds_path = os.getenv("GOOGLE_SERVICE_ACCOUNT_FILE") or os.getenv(
+        "GOOGLE_APPLICATION_CREDENTIALS"
+    )
+    if not creds_path:
+        raise RuntimeError(
+            "Service account auth is required. Set GOOGLE_SERVICE_ACCOUNT_FILE "
+            "(or GOOGLE_APPLICATION_CREDENTIALS) to your service account JSON path."
+        )
+
+    subject = os.getenv("GOOGLE_IMPERSONATE_USER") or None
+    return tuple(scopes), creds_path, subject
+
+
 def get_google_credentials(scopes: Sequence[str]) -> Credentials:
-    return _service_account_credentials(scopes)
+    return _service_account_credentials(*credentials_key(scopes))
@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import struct
+import tempfile
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Callable, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class ResponseCache:
+    """Process-local LRU cache whose entries expire ``ttl_seconds`` after being stored.
+
+    Entries are bounded both by count and by total weight, as reported by the
+    ``weigh`` callable given to each fetch (rows, for reports); values heavier than
+    ``max_weight`` are returned without being stored. Concurrent misses on one key
+    share a single fetch. A non-positive TTL disables caching.
+    """
+
+    def __init__(self, ttl_seconds: float, max_weight: int, maxsize: int = 32) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_weight = max_weight
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Hashable, tuple[float, int, object]] = OrderedDict()
+        self._weight = 0
+        self._inflight: dict[Hashable, Future[object]] = {}
+        self._lock = threading.Lock()
+
+    def get_or_fetch(
+        self,
+        key: Hashable,
+        fetch: Callable[[], T],
+        weigh: Callable[[T], int] = lambda value: 1,
+    ) -> T:
+        if self.ttl_seconds <= 0:
+            return fetch()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, weight, value = entry
+                if expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    return value  # type: ignore[return-value]
+                del self._entries[key]
+                self._weight -= weight
+            pending = self._inflight.get(key)
+            if pending is None:
+                future: Future[object] = Future()
+                self._inflight[key] = future
+
+        if pending is not None:
+            return pending.result()  # type: ignore[return-value]
+
+        try:
+            value = fetch()
+        except BaseException as exc:
+            with self._lock:
+                del self._inflight[key]
+            future.set_exception(exc)
+            raise
+
+        weight = weigh(value)
+        with self._lock:
+            del self._inflight[key]
+            if weight <= self.max_weight:
+                self._entries[key] = (time.monotonic() + self.ttl_seconds, weight, value)
+                self._weight += weight
+                while len(self._entries) > self.maxsize or self._weight > self.max_weight:
+                    _, (_, evicted, _) = self._entries.popitem(last=False)
+                    self._weight -= evicted
+        future.set_result(value)
+        return value
+
+
+_EXPIRY = struct.Struct("<d")
+_ENTRY_NAME = re.compile(r"[0-9a-f]{64}")
+_SWEEP_INTERVAL_SECONDS = 5 * 60
+_STALE_TMP_SECONDS = 60 * 60
+
+
+class DiskCache:
+    """File-per-entry cache that lets a restarted server reuse earlier responses.
+
+    Each file holds its wall-clock expiry followed by the zlib-compressed JSON of the
+    value, so only JSON-compatible values can be cached. ``directory=None`` disables
+    the cache; unreadable entries are treated as misses, stale ones are removed when
+    read, and failed writes are ignored. Writes periodically sweep the directory,
+    removing expired entries and then the oldest ones until it fits ``max_bytes``.
+    """
+
+    def __init__(self, directory: str | None, max_bytes: int) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._next_sweep = 0.0
+        self._sweep_lock = threading.Lock()
+
+    def _path(self, key: Hashable) -> str:
+        digest = hashlib.sha256(repr(key).encode("utf-8")).hexdigest()
+        return os.path.join(self.directory or "", digest)
+
+    def _sweep(self, directory: str) -> None:
+        now = time.time()
+        live: list[tuple[float, int, str]] = []
+        total = 0
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                try:
+                    if entry.name.endswith(".tmp"):
+                        if entry.stat().st_mtime < now - _STALE_TMP_SECONDS:
+                            os.unlink(entry.path)
+                        continue
+                    if not _ENTRY_NAME.fullmatch(entry.name):
+                        continue
+                    with open(entry.path, "rb") as handle:
+                        (expires_at,) = _EXPIRY.unpack(handle.read(_EXPIRY.size))
+                    if expires_at <= now:
+                        os.unlink(entry.path)
+                        continue
+                    stat = entry.stat()
+                except (OSError, struct.error):
+                    continue
+                live.append((stat.st_mtime, stat.st_size, entry.path))
+                total += stat.st_size
+
+        live.sort()
+        for _, size, path in live:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+            total -= size
+
+    def _maybe_sweep(self, directory: str) -> None:
+        if not self._sweep_lock.acquire(blocking=False):
+            return
+        try:
+            if time.monotonic() < self._next_sweep:
+                return
+            self._next_sweep = time.monotonic() + _SWEEP_INTERVAL_SECONDS
+            self._sweep(directory)
+        except OSError:
+            pass
+        finally:
+            self._sweep_lock.release()
+
+    def get_or_fetch(
+        self,
+        key: Hashable,
+        fetch: Callable[[], T],
+        ttl_seconds: float,
+    ) -> T:
+        if not self.directory or ttl_seconds <= 0:
+            return fetch()
+
+        path = self._path(key)
+        try:
+            with open(path, "rb") as handle:
+                data = handle.read()
+            (expires_at,) = _EXPIRY.unpack_from(data)
+            if expires_at > time.time():
+                return json.loads(zlib.decompress(data[_EXPIRY.size :]))
+            os.unlink(path)
+        except (OSError, struct.error, zlib.error, UnicodeDecodeError, json.JSONDecodeError):
+            pass
+
+        value = fetch()
+
+        payload = _EXPIRY.pack(time.time() + ttl_seconds) + zlib.compress(
+            json.dumps(value, separators=(",", ":")).encode("utf-8"), 1
+        )
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            # Renamed into place so readers never see a partial file.
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as handle:
+                    handle.write(payload)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError:
+            pass
+        self._maybe_sweep(self.directory)
+        return value
@@ -5,11 +5,13 @@ from dataclasses import dataclass
 from datetime import date, datetime, timedelta
 from functools import lru_cache
 
+_TRUTHY = frozenset({"1", "true", "yes", "on"})
+
 
 def _parse_bool(value: str | None, default: bool) -> bool:
     if value is None:
         return default
-    return value.strip().lower() in {"1", "true", "yes", "on"}
+    return value.strip().lower() in _TRUTHY
 
 
 def _parse_int(value: str | None, default: int) -> int:
@@ -21,6 +23,7 @@ def _parse_int(value: str | None, default: int) -> int:
         return default
 
 
+@lru_cache(maxsize=1024)
 def parse_date(value: str) -> date:
     return datetime.strptime(value, "%Y-%m-%d").date()
 
@@ -40,6 +43,10 @@ class Settings:
     default_ga4_property_id: str | None
     default_lookback_days: int
     canonical_base_url: str | None
+    response_cache_ttl_seconds: int
+    response_cache_max_rows: int
+    disk_cache_dir: str | None
+    disk_cache_max_mb: int
 
     min_impressions_for_ctr_action: int
     min_sessions_for_conversion_action: int
@@ -50,26 +57,35 @@ class Settings:
 
 @lru_cache(maxsize=1)
 def load_settings() -> Settings:
+    env = os.environ
     return Settings(
-        enable_gsc=_parse_bool(os.getenv("ENABLE_GSC"), True),
-        enable_ga4=_parse_bool(os.getenv("ENABLE_GA4"), True),
+        enable_gsc=_parse_bool(env.get("ENABLE_GSC"), True),
+        enable_ga4=_parse_bool(env.get("ENABLE_GA4"), True),
         require_explicit_gsc_site_url=_parse_bool(
-            os.getenv("REQUIRE_EXPLICIT_GSC_SITE_URL"),
+            env.get("REQUIRE_EXPLICIT_GSC_SITE_URL"),
             True,
         ),
-        default_gsc_site_url=os.getenv("DEFAULT_GSC_SITE_URL") or None,
-        default_ga4_property_id=os.getenv("DEFAULT_GA4_PROPERTY_ID") or None,
-        default_lookback_days=_parse_int(os.getenv("DEFAULT_LOOKBACK_DAYS"), 28),
-        canonical_base_url=os.getenv("CANONICAL_BASE_URL") or None,
+        default_gsc_site_url=env.get("DEFAULT_GSC_SITE_URL") or None,
+        default_ga4_property_id=env.get("DEFAULT_GA4_PROPERTY_ID") or None,
+        default_lookback_days=_parse_int(env.get("DEFAULT_LOOKBACK_DAYS"), 28),
+        canonical_base_url=env.get("CANONICAL_BASE_URL") or None,
+        response_cache_ttl_seconds=_parse_int(
+            env.get("RESPONSE_CACHE_TTL_SECONDS"), 300
+        ),
+        response_cache_max_rows=_parse_int(
+            env.get("RESPONSE_CACHE_MAX_ROWS"), 200000
+        ),
+        disk_cache_dir=env.get("DISK_CACHE_DIR") or None,
+        disk_cache_max_mb=_parse_int(env.get("DISK_CACHE_MAX_MB"), 256),
         min_impressions_for_ctr_action=_parse_int(
-            os.getenv("MIN_IMPRESSIONS_FOR_CTR_ACTION"), 200
+            env.get("MIN_IMPRESSIONS_FOR_CTR_ACTION"), 200
         ),
         min_sessions_for_conversion_action=_parse_int(
-            os.getenv("MIN_SESSIONS_FOR_CONVERSION_ACTION"), 50
+            env.get("MIN_SESSIONS_FOR_CONVERSION_ACTION"), 50
         ),
-        target_ctr=float(os.getenv("TARGET_CTR", "0.03")),
-        target_conversion_rate=float(os.getenv("TARGET_CONVERSION_RATE", "0.02")),
-        default_max_action_items=_parse_int(os.getenv("DEFAULT_MAX_ACTION_ITEMS"), 30),
+        target_ctr=float(env.get("TARGET_CTR", "0.03")),
+        target_conversion_rate=float(env.get("TARGET_CONVERSION_RATE", "0.02")),
+        default_max_action_items=_parse_int(env.get("DEFAULT_MAX_ACTION_ITEMS"), 30),
     )
 
 
@@ -78,7 +94,20 @@ def current_and_previous_ranges(
     end_date: str | None,
     lookback_days: int,
 ) -> dict[str, tuple[str, str]]:
-    today = date.today()
+    current, previous = _ranges(
+        start_date, end_date, lookback_days, date.today().toordinal()
+    )
+    return {"current": current, "previous": previous}
+
+
+@lru_cache(maxsize=64)
+def _ranges(
+    start_date: str | None,
+    end_date: str | None,
+    lookback_days: int,
+    today_ordinal: int,
+) -> tuple[tuple[str, str], tuple[str, str]]:
+    today = date.fromordinal(today_ordinal)
     end = as_date(end_date, today - timedelta(days=1))
 
     if start_date:
@@ -90,7 +119,7 @@ def current_and_previous_ranges(
     prev_end = start - timedelta(days=1)
     prev_start = prev_end - timedelta(days=span_days - 1)
 
-    return {
-        "current": (start.isoformat(), end.isoformat()),
-        "previous": (prev_start.isoformat(), prev_end.isoformat()),
-    }
+    return (
+        (start.isoformat(), end.isoformat()),
+        (prev_start.isoformat(), prev_end.isoformat()),
+    )
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import json
+from functools import lru_cache
 from typing import Any, Sequence
 
 from google.analytics.data_v1beta import BetaAnalyticsDataClient
@@ -10,112 +12,153 @@ from google.analytics.data_v1beta.types import (
     FilterExpression,
     FilterExpressionList,
     Metric,
+    MetricType,
     NumericValue,
     OrderBy,
     RunReportRequest,
 )
 
-from seo_analytics_mcp.auth import get_google_credentials
+from seo_analytics_mcp.auth import CredentialsKey, credentials_key, get_google_credentials
+from seo_analytics_mcp.connectors.pagination import fetch_pages
 
+_STRING_MATCH_TYPES: dict[str, Filter.StringFilter.MatchType] = {
+    name: getattr(Filter.StringFilter.MatchType, name)
+    for name in (
+        "EXACT",
+        "BEGINS_WITH",
+        "ENDS_WITH",
+        "CONTAINS",
+        "FULL_REGEXP",
+        "PARTIAL_REGEXP",
+    )
+}
 
-class GA4Connector:
-    SCOPES = ("https://www.googleapis.com/auth/analytics.readonly",)
+_NUMERIC_OPERATIONS: dict[str, Filter.NumericFilter.Operation] = {
+    name: getattr(Filter.NumericFilter.Operation, name)
+    for name in (
+        "EQUAL",
+        "GREATER_THAN",
+        "GREATER_THAN_OR_EQUAL",
+        "LESS_THAN",
+        "LESS_THAN_OR_EQUAL",
+    )
+}
 
-    def __init__(self) -> None:
-        credentials = get_google_credentials(self.SCOPES)
-        self._client = BetaAnalyticsDataClient(credentials=credentials)
-
-    def _string_match_type(self, op: str) -> Filter.StringFilter.MatchType:
-        lookup = {
-            "EXACT": Filter.StringFilter.MatchType.EXACT,
-            "BEGINS_WITH": Filter.StringFilter.MatchType.BEGINS_WITH,
-            "ENDS_WITH": Filter.StringFilter.MatchType.ENDS_WITH,
-            "CONTAINS": Filter.StringFilter.MatchType.CONTAINS,
-            "FULL_REGEXP": Filter.StringFilter.MatchType.FULL_REGEXP,
-            "PARTIAL_REGEXP": Filter.StringFilter.MatchType.PARTIAL_REGEXP,
-        }
-        try:
-            return lookup[op.upper()]
-        except KeyError as exc:
-            raise ValueError(f"Unsupported string filter op: {op}") from exc
-
-    def _numeric_operation(self, op: str) -> Filter.NumericFilter.Operation:
-        lookup = {
-            "EQUAL": Filter.NumericFilter.Operation.EQUAL,
-            "GREATER_THAN": Filter.NumericFilter.Operation.GREATER_THAN,
-            "GREATER_THAN_OR_EQUAL": Filter.NumericFilter.Operation.GREATER_THAN_OR_EQUAL,
-            "LESS_THAN": Filter.NumericFilter.Operation.LESS_THAN,
-            "LESS_THAN_OR_EQUAL": Filter.NumericFilter.Operation.LESS_THAN_OR_EQUAL,
-        }
-        try:
-            return lookup[op.upper()]
-        except KeyError as exc:
-            raise ValueError(f"Unsupported numeric op: {op}") from exc
-
-    def _number_value(self, value: float | int) -> NumericValue:
-        if isinstance(value, int):
-            return NumericValue(int64_value=value)
-        return NumericValue(double_value=float(value))
-
-    def _build_filter_expression(self, spec: dict[str, Any]) -> FilterExpression:
-        if "and" in spec:
-            return FilterExpression(
-                and_group=FilterExpressionList(
-                    expressions=[
-                        self._build_filter_expression(item) for item in spec["and"]
-                    ]
-                )
-            )
 
-        if "or" in spec:
-            return FilterExpression(
-                or_group=FilterExpressionList(
-                    expressions=[
-                        self._build_filter_expression(item) for item in spec["or"]
-                    ]
-                )
-            )
+def _parse_metric_value(value: str) -> Any:
+    try:
+        if "." in value:
+            return float(value)
+        return int(value)
+    except ValueError:
+        return value
 
-        if "not" in spec:
-            return FilterExpression(
-                not_expression=self._build_filter_expression(spec["not"])
-            )
 
-        field = spec["field"]
-        op = str(spec.get("op", "EXACT")).upper()
-
-        if op == "IN_LIST":
-            in_list = Filter.InListFilter(values=[str(v) for v in spec.get("values", [])])
-            return FilterExpression(filter=Filter(field_name=field, in_list_filter=in_list))
-
-        if op.startswith("NUMERIC_"):
-            numeric_op = op.replace("NUMERIC_", "", 1)
-            if numeric_op == "BETWEEN":
-                from_value = self._number_value(spec["from"])
-                to_value = self._number_value(spec["to"])
-                between = Filter.BetweenFilter(from_value=from_value, to_value=to_value)
-                return FilterExpression(
-                    filter=Filter(field_name=field, between_filter=between)
-                )
+def _parse_integer_metric_value(value: str) -> Any:
+    try:
+        return int(value)
+    except ValueError:
+        return _parse_metric_value(value)
+
+
+def _string_match_type(op: str) -> Filter.StringFilter.MatchType:
+    try:
+        return _STRING_MATCH_TYPES[op.upper()]
+    except KeyError as exc:
+        raise ValueError(f"Unsupported string filter op: {op}") from exc
+
+
+def _numeric_operation(op: str) -> Filter.NumericFilter.Operation:
+    try:
+        return _NUMERIC_OPERATIONS[op.upper()]
+    except KeyError as exc:
+        raise ValueError(f"Unsupported numeric op: {op}") from exc
 
-            value = self._number_value(spec["value"])
-            numeric_filter = Filter.NumericFilter(
-                operation=self._numeric_operation(numeric_op),
-                value=value,
+
+def _number_value(value: float | int) -> NumericValue:
+    if type(value) is int:
+        return NumericValue(int64_value=value)
+    return NumericValue(double_value=float(value))
+
+
+def _build_filter_expression(spec: dict[str, Any]) -> FilterExpression:
+    if "and" in spec:
+        return FilterExpression(
+            and_group=FilterExpressionList(
+                expressions=[_build_filter_expression(item) for item in spec["and"]]
             )
-            return FilterExpression(
-                filter=Filter(field_name=field, numeric_filter=numeric_filter)
+        )
+
+    if "or" in spec:
+        return FilterExpression(
+            or_group=FilterExpressionList(
+                expressions=[_build_filter_expression(item) for item in spec["or"]]
             )
+        )
+
+    if "not" in spec:
+        return FilterExpression(not_expression=_build_filter_expression(spec["not"]))
+
+    field = spec["field"]
+    op = str(spec.get("op", "EXACT")).upper()
 
-        string_filter = Filter.StringFilter(
-            match_type=self._string_match_type(op),
-            value=str(spec["value"]),
-            case_sensitive=bool(spec.get("case_sensitive", False)),
+    if op == "IN_LIST":
+        in_list = Filter.InListFilter(values=[str(v) for v in spec.get("values", [])])
+        return FilterExpression(filter=Filter(field_name=field, in_list_filter=in_list))
+
+    if op.startswith("NUMERIC_"):
+        numeric_op = op.replace("NUMERIC_", "", 1)
+        if numeric_op == "BETWEEN":
+            from_value = _number_value(spec["from"])
+            to_value = _number_value(spec["to"])
+            between = Filter.BetweenFilter(from_value=from_value, to_value=to_value)
+            return FilterExpression(filter=Filter(field_name=field, between_filter=between))
+
+        value = _number_value(spec["value"])
+        numeric_filter = Filter.NumericFilter(
+            operation=_numeric_operation(numeric_op),
+            value=value,
         )
         return FilterExpression(
-            filter=Filter(field_name=field, string_filter=string_filter)
+            filter=Filter(field_name=field, numeric_filter=numeric_filter)
         )
 
+    string_filter = Filter.StringFilter(
+        match_type=_string_match_type(op),
+        value=str(spec["value"]),
+        case_sensitive=bool(spec.get("case_sensitive", False)),
+    )
+    return FilterExpression(filter=Filter(field_name=field, string_filter=string_filter))
+
+
+@lru_cache(maxsize=128)
+def _cached_filter_expression(spec_json: str) -> FilterExpression:
+    # Request assignment copies the message, so the cached tree is never mutated.
+    return _build_filter_expression(json.loads(spec_json))
+
+
+def _filter_expression(spec: dict[str, Any] | None) -> FilterExpression | None:
+    if not spec:
+        return None
+    return _cached_filter_expression(json.dumps(spec, sort_keys=True))
+
+
+# One client per credentials key, shared by every connector in the process.
+_CLIENTS: dict[CredentialsKey, BetaAnalyticsDataClient] = {}
+
+
+class GA4Connector:
+    SCOPES = ("https://www.googleapis.com/auth/analytics.readonly",)
+
+    def __init__(self) -> None:
+        self.credentials_id = credentials_key(self.SCOPES)
+        client = _CLIENTS.get(self.credentials_id)
+        if client is None:
+            credentials = get_google_credentials(self.SCOPES)
+            client = BetaAnalyticsDataClient(credentials=credentials)
+            _CLIENTS[self.credentials_id] = client
+        self._client = client
+
     def _build_order_bys(self, order_bys: Sequence[dict[str, Any]]) -> list[OrderBy]:
         result: list[OrderBy] = []
         for item in order_bys:
@@ -140,7 +183,7 @@ class GA4Connector:
                 )
         return result
 
-    def run_report(
+    def _build_request(
         self,
         property_id: str,
         start_date: str,
@@ -148,54 +191,98 @@ class GA4Connector:
         *,
         dimensions: Sequence[str],
         metrics: Sequence[str],
-        limit: int = 10000,
-        offset: int = 0,
         keep_empty_rows: bool = False,
         currency_code: str | None = None,
         dimension_filter: dict[str, Any] | None = None,
         metric_filter: dict[str, Any] | None = None,
         order_bys: Sequence[dict[str, Any]] | None = None,
-    ) -> dict[str, Any]:
+    ) -> RunReportRequest:
         request = RunReportRequest(
             property=f"properties/{property_id}",
             dimensions=[Dimension(name=name) for name in dimensions],
             metrics=[Metric(name=name) for name in metrics],
             date_ranges=[DateRange(start_date=start_date, end_date=end_date)],
-            limit=limit,
-            offset=offset,
             keep_empty_rows=keep_empty_rows,
         )
 
         if currency_code:
             request.currency_code = currency_code
-        if dimension_filter:
-            request.dimension_filter = self._build_filter_expression(dimension_filter)
-        if metric_filter:
-            request.metric_filter = self._build_filter_expression(metric_filter)
+        dimension_expression = _filter_expression(dimension_filter)
+        if dimension_expression is not None:
+            request.dimension_filter = dimension_expression
+        metric_expression = _filter_expression(metric_filter)
+        if metric_expression is not None:
+            request.metric_filter = metric_expression
         if order_bys:
             request.order_bys.extend(self._build_order_bys(order_bys))
 
+        return request
+
+    def _run_report_page(
+        self,
+        request: RunReportRequest,
+    ) -> tuple[list[dict[str, Any]], int]:
         response = self._client.run_report(request)
 
         rows: list[dict[str, Any]] = []
-        dim_headers = [h.name for h in response.dimension_headers]
-        metric_headers = [h.name for h in response.metric_headers]
+        dim_headers = tuple(h.name for h in response.dimension_headers)
+        metric_headers = tuple(h.name for h in response.metric_headers)
+        metric_parsers = tuple(
+            _parse_integer_metric_value
+            if h.type_ == MetricType.TYPE_INTEGER
+            else _parse_metric_value
+            for h in response.metric_headers
+        )
 
         for row in response.rows:
-            row_data: dict[str, Any] = {}
-            for i, header in enumerate(dim_headers):
-                row_data[header] = row.dimension_values[i].value
-            for i, header in enumerate(metric_headers):
-                value = row.metric_values[i].value
-                try:
-                    if "." in value:
-                        row_data[header] = float(value)
-                    else:
-                        row_data[header] = int(value)
-                except ValueError:
-                    row_data[header] = value
+            row_data: dict[str, Any] = dict(
+                zip(dim_headers, [v.value for v in row.dimension_values])
+            )
+            row_data.update(
+                zip(
+                    metric_headers,
+                    [
+                        parse(v.value)
+                        for parse, v in zip(metric_parsers, row.metric_values)
+                    ],
+                )
+            )
             rows.append(row_data)
 
+        return rows, response.row_count
+
+    def run_report(
+        self,
+        property_id: str,
+        start_date: str,
+        end_date: str,
+        *,
+        dimensions: Sequence[str],
+        metrics: Sequence[str],
+        limit: int = 10000,
+        offset: int = 0,
+        keep_empty_rows: bool = False,
+        currency_code: str | None = None,
+        dimension_filter: dict[str, Any] | None = None,
+        metric_filter: dict[str, Any] | None = None,
+        order_bys: Sequence[dict[str, Any]] | None = None,
+    ) -> dict[str, Any]:
+        request = self._build_request(
+            property_id,
+            start_date,
+            end_date,
+            dimensions=dimensions,
+            metrics=metrics,
+            keep_empty_rows=keep_empty_rows,
+            currency_code=currency_code,
+            dimension_filter=dimension_filter,
+            metric_filter=metric_filter,
+            order_bys=order_bys,
+        )
+        request.limit = limit
+        request.offset = offset
+        rows, row_count = self._run_report_page(request)
+
         return {
             "property_id": property_id,
             "start_date": start_date,
@@ -203,7 +290,7 @@ class GA4Connector:
             "dimensions": list(dimensions),
             "metrics": list(metrics),
             "rows": rows,
-            "row_count": response.row_count,
+            "row_count": row_count,
             "returned_rows": len(rows),
             "limit": limit,
             "offset": offset,
@@ -225,38 +312,36 @@ class GA4Connector:
         metric_filter: dict[str, Any] | None = None,
         order_bys: Sequence[dict[str, Any]] | None = None,
     ) -> dict[str, Any]:
-        all_rows: list[dict[str, Any]] = []
-        offset = 0
-        row_count: int | None = None
-
-        while offset < max_rows:
-            response = self.run_report(
-                property_id,
-                start_date,
-                end_date,
-                dimensions=dimensions,
-                metrics=metrics,
-                limit=min(page_size, max_rows - offset),
-                offset=offset,
-                keep_empty_rows=keep_empty_rows,
-                currency_code=currency_code,
-                dimension_filter=dimension_filter,
-                metric_filter=metric_filter,
-                order_bys=order_bys,
-            )
+        # Each page works on its own copy, as pages may be fetched concurrently.
+        template = self._build_request(
+            property_id,
+            start_date,
+            end_date,
+            dimensions=dimensions,
+            metrics=metrics,
+            keep_empty_rows=keep_empty_rows,
+            currency_code=currency_code,
+            dimension_filter=dimension_filter,
+            metric_filter=metric_filter,
+            order_bys=order_bys,
+        )
 
-            rows = response["rows"]
-            row_count = response.get("row_count")
-            if not rows:
-                break
+        def fetch(offset: int) -> tuple[list[dict[str, Any]], int]:
+            request = RunReportRequest(template)
+            request.limit = min(page_size, max_rows - offset)
+            request.offset = offset
+            return self._run_report_page(request)
 
-            all_rows.extend(rows)
-            if len(rows) < page_size:
-                break
-            if row_count is not None and len(all_rows) >= row_count:
-                break
+        all_rows: list[dict[str, Any]] = []
+        row_count: int | None = None
 
-            offset += len(rows)
+        if max_rows > 0:
+            all_rows, row_count = fetch(0)
+            if len(all_rows) >= page_size:
+                offsets = range(len(all_rows), min(row_count, max_rows), page_size)
+                all_rows.extend(
+                    fetch_pages(lambda offset: fetch(offset)[0], offsets, page_size)
+                )
 
         return {
             "property_id": property_id,
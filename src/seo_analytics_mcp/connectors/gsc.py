@@ -1,26 +1,50 @@
 from __future__ import annotations
 
+import threading
 from typing import Any, Sequence
 
+from google_auth_httplib2 import AuthorizedHttp
 from googleapiclient.discovery import build
+from googleapiclient.http import build_http
 
-from seo_analytics_mcp.auth import get_google_credentials
+from seo_analytics_mcp.auth import CredentialsKey, credentials_key, get_google_credentials
+from seo_analytics_mcp.connectors.pagination import fetch_pages
+
+# One discovery service per credentials key. httplib2 is not thread-safe, so each
+# thread keeps its own keep-alive transport per key.
+_SERVICES: dict[CredentialsKey, Any] = {}
+_local = threading.local()
 
 
 class GSCConnector:
     SCOPES = ("https://www.googleapis.com/auth/webmasters.readonly",)
 
     def __init__(self) -> None:
-        credentials = get_google_credentials(self.SCOPES)
-        self._service = build(
-            "searchconsole",
-            "v1",
-            credentials=credentials,
-            cache_discovery=False,
-        )
+        self.credentials_id = credentials_key(self.SCOPES)
+        self._credentials = get_google_credentials(self.SCOPES)
+        service = _SERVICES.get(self.credentials_id)
+        if service is None:
+            service = build(
+                "searchconsole",
+                "v1",
+                http=self._http(),
+                cache_discovery=False,
+            )
+            _SERVICES[self.credentials_id] = service
+        self._service = service
+
+    def _http(self) -> AuthorizedHttp:
+        pool: dict[CredentialsKey, AuthorizedHttp] | None = getattr(_local, "http", None)
+        if pool is None:
+            pool = _local.http = {}
+        http = pool.get(self.credentials_id)
+        if http is None:
+            http = AuthorizedHttp(self._credentials, http=build_http())
+            pool[self.credentials_id] = http
+        return http
 
     def list_sites(self) -> list[dict[str, Any]]:
-        response = self._service.sites().list().execute()
+        response = self._service.sites().list().execute(http=self._http())
         return response.get("siteEntry", [])
 
     def search_analytics(
@@ -54,7 +78,8 @@ class GSCConnector:
         if dimension_filter_groups:
             body["dimensionFilterGroups"] = list(dimension_filter_groups)
 
-        return self._service.searchanalytics().query(siteUrl=site_url, body=body).execute()
+        request = self._service.searchanalytics().query(siteUrl=site_url, body=body)
+        return request.execute(http=self._http())
 
     def search_analytics_all(
         self,
@@ -70,10 +95,7 @@ class GSCConnector:
         page_size: int = 25000,
         max_rows: int = 100000,
     ) -> dict[str, Any]:
-        all_rows: list[dict[str, Any]] = []
-        start_row = 0
-
-        while start_row < max_rows:
+        def fetch(start_row: int) -> list[dict[str, Any]]:
             response = self.search_analytics(
                 site_url,
                 start_date,
@@ -86,15 +108,16 @@ class GSCConnector:
                 aggregation_type=aggregation_type,
                 dimension_filter_groups=dimension_filter_groups,
             )
-            rows = response.get("rows", [])
-            if not rows:
-                break
+            return response.get("rows", [])
 
-            all_rows.extend(rows)
-            if len(rows) < page_size:
-                break
+        all_rows: list[dict[str, Any]] = []
 
-            start_row += len(rows)
+        if max_rows > 0:
+            all_rows = fetch(0)
+            # No total is reported, so further pages are fetched speculatively.
+            if len(all_rows) >= page_size:
+                offsets = range(page_size, max_rows, page_size)
+                all_rows.extend(fetch_pages(fetch, offsets, page_size))
 
         return {
             "rows": all_rows,
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Sequence
+
+PAGE_FETCH_WORKERS = 4
+
+# Shared by every report, so at most PAGE_FETCH_WORKERS follow-on pages are in flight
+# per process; first pages run on the caller's thread (see server.REPORT_FETCH_WORKERS
+# for the full policy). Long-lived so per-thread HTTP transports stay warm.
+_executor = ThreadPoolExecutor(
+    max_workers=PAGE_FETCH_WORKERS,
+    thread_name_prefix="seo-analytics-page",
+)
+
+
+def fetch_pages(
+    fetch: Callable[[int], list[dict[str, Any]]],
+    offsets: Sequence[int],
+    page_size: int,
+) -> list[dict[str, Any]]:
+    """Fetch pages at ``offsets`` concurrently and concatenate them in offset order.
+
+    Pages are requested in waves of ``PAGE_FETCH_WORKERS`` so that a result set ending
+    early never costs more than one wave of extra requests. Collection stops at the
+    first empty or short page, matching sequential pagination.
+    """
+    rows: list[dict[str, Any]] = []
+    for start in range(0, len(offsets), PAGE_FETCH_WORKERS):
+        wave = offsets[start : start + PAGE_FETCH_WORKERS]
+        for page in _executor.map(fetch, wave):
+            if not page:
+                return rows
+            rows.extend(page)
+            if len(page) < page_size:
+                return rows
+    return rows
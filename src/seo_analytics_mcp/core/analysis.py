@@ -1,10 +1,13 @@
 from __future__ import annotations
 
-from typing import Any
+import heapq
+from typing import Any, Iterable, TypeVar
 
 from seo_analytics_mcp.config import Settings
 from seo_analytics_mcp.core.normalization import compute_delta_pct
-from seo_analytics_mcp.core.scoring import score_page
+from seo_analytics_mcp.core.scoring import ScoreResult, score_page
+
+T = TypeVar("T")
 
 
 def merge_page_metrics(
@@ -20,46 +23,50 @@ def merge_page_metrics(
     ga4_previous = ga4_previous or {}
 
     urls = sorted(
-        set(gsc_current.keys())
-        | set(ga4_current.keys())
-        | set(gsc_previous.keys())
-        | set(ga4_previous.keys())
+        gsc_current.keys() | ga4_current.keys() | gsc_previous.keys() | ga4_previous.keys()
     )
 
     merged: list[dict[str, Any]] = []
 
     for url in urls:
-        current_g = dict(gsc_current.get(url, {}))
-        current_a = dict(ga4_current.get(url, {}))
-        prev_g = dict(gsc_previous.get(url, {}))
-        prev_a = dict(ga4_previous.get(url, {}))
+        current_g = gsc_current.get(url) or {}
+        current_a = ga4_current.get(url) or {}
+        prev_g = gsc_previous.get(url)
+        prev_a = ga4_previous.get(url)
 
-        row: dict[str, Any] = {"url": url}
-        row.update(current_g)
-        row.update(current_a)
+        row: dict[str, Any] = {"url": url, **current_g, **current_a}
 
+        prev_clicks = 0.0
+        prev_impressions = 0.0
+        prev_sessions = 0.0
+        prev_conversions = 0.0
         if prev_g:
-            row["gsc_prev_clicks"] = float(prev_g.get("gsc_clicks", 0.0))
-            row["gsc_prev_impressions"] = float(prev_g.get("gsc_impressions", 0.0))
+            prev_clicks = float(prev_g.get("gsc_clicks", 0.0))
+            prev_impressions = float(prev_g.get("gsc_impressions", 0.0))
+            row["gsc_prev_clicks"] = prev_clicks
+            row["gsc_prev_impressions"] = prev_impressions
         if prev_a:
-            row["ga4_prev_sessions"] = float(prev_a.get("ga4_sessions", 0.0))
-            row["ga4_prev_conversions"] = float(prev_a.get("ga4_conversions", 0.0))
+            prev_sessions = float(prev_a.get("ga4_sessions", 0.0))
+            prev_conversions = float(prev_a.get("ga4_conversions", 0.0))
+            row["ga4_prev_sessions"] = prev_sessions
+            row["ga4_prev_conversions"] = prev_conversions
 
+        # Deltas are floats, or None when there is no baseline.
         row["gsc_clicks_delta_pct"] = compute_delta_pct(
-            float(row.get("gsc_clicks", 0.0)),
-            float(row.get("gsc_prev_clicks", 0.0)),
+            float(current_g.get("gsc_clicks", 0.0)),
+            prev_clicks,
         )
         row["gsc_impressions_delta_pct"] = compute_delta_pct(
-            float(row.get("gsc_impressions", 0.0)),
-            float(row.get("gsc_prev_impressions", 0.0)),
+            float(current_g.get("gsc_impressions", 0.0)),
+            prev_impressions,
         )
         row["ga4_sessions_delta_pct"] = compute_delta_pct(
-            float(row.get("ga4_sessions", 0.0)),
-            float(row.get("ga4_prev_sessions", 0.0)),
+            float(current_a.get("ga4_sessions", 0.0)),
+            prev_sessions,
         )
         row["ga4_conversions_delta_pct"] = compute_delta_pct(
-            float(row.get("ga4_conversions", 0.0)),
-            float(row.get("ga4_prev_conversions", 0.0)),
+            float(current_a.get("ga4_conversions", 0.0)),
+            prev_conversions,
         )
 
         merged.append(row)
@@ -69,10 +76,15 @@ def merge_page_metrics(
 
 def summarize_portfolio(merged_pages: list[dict[str, Any]]) -> dict[str, Any]:
     total_pages = len(merged_pages)
-    total_clicks = sum(float(p.get("gsc_clicks", 0.0)) for p in merged_pages)
-    total_impressions = sum(float(p.get("gsc_impressions", 0.0)) for p in merged_pages)
-    total_sessions = sum(float(p.get("ga4_sessions", 0.0)) for p in merged_pages)
-    total_conversions = sum(float(p.get("ga4_conversions", 0.0)) for p in merged_pages)
+    total_clicks = 0.0
+    total_impressions = 0.0
+    total_sessions = 0.0
+    total_conversions = 0.0
+    for p in merged_pages:
+        total_clicks += p.get("gsc_clicks", 0.0)
+        total_impressions += p.get("gsc_impressions", 0.0)
+        total_sessions += p.get("ga4_sessions", 0.0)
+        total_conversions += p.get("ga4_conversions", 0.0)
 
     portfolio_ctr = total_clicks / total_impressions if total_impressions > 0 else 0.0
     portfolio_conversion_rate = (
@@ -90,6 +102,32 @@ def summarize_portfolio(merged_pages: list[dict[str, Any]]) -> dict[str, Any]:
     }
 
 
+def _action_item(page: dict[str, Any], result: ScoreResult) -> dict[str, Any]:
+    return {
+        "url": page["url"],
+        "score": result.score,
+        "priority": result.priority,
+        "category": result.categories[0] if result.categories else "opportunity",
+        "categories": result.categories,
+        "expected_impact": result.expected_impact,
+        "effort": result.effort,
+        "confidence": result.confidence,
+        "reasons": result.reasons,
+        "recommended_actions": result.recommendations,
+        "evidence": {
+            "gsc_impressions": round(page.get("gsc_impressions", 0.0), 2),
+            "gsc_clicks": round(page.get("gsc_clicks", 0.0), 2),
+            "gsc_ctr": round(page.get("gsc_ctr", 0.0), 4),
+            "gsc_position": round(page.get("gsc_position", 0.0), 2),
+            "ga4_sessions": round(page.get("ga4_sessions", 0.0), 2),
+            "ga4_engagement_rate": round(page.get("ga4_engagement_rate", 0.0), 4),
+            "ga4_conversion_rate": round(page.get("ga4_conversion_rate", 0.0), 4),
+            "gsc_clicks_delta_pct": page.get("gsc_clicks_delta_pct"),
+            "ga4_sessions_delta_pct": page.get("ga4_sessions_delta_pct"),
+        },
+    }
+
+
 def generate_action_items(
     merged_pages: list[dict[str, Any]],
     settings: Settings,
@@ -97,44 +135,39 @@ def generate_action_items(
     max_items: int | None = None,
 ) -> list[dict[str, Any]]:
     limit = max_items if max_items is not None else settings.default_max_action_items
-    items: list[dict[str, Any]] = []
-
-    for page in merged_pages:
-        result = score_page(page, settings)
-        if result.score <= 0:
-            continue
-
-        item = {
-            "url": page["url"],
-            "score": result.score,
-            "priority": result.priority,
-            "category": result.categories[0] if result.categories else "opportunity",
-            "categories": result.categories,
-            "expected_impact": result.expected_impact,
-            "effort": result.effort,
-            "confidence": result.confidence,
-            "reasons": result.reasons,
-            "recommended_actions": result.recommendations,
-            "evidence": {
-                "gsc_impressions": round(float(page.get("gsc_impressions", 0.0)), 2),
-                "gsc_clicks": round(float(page.get("gsc_clicks", 0.0)), 2),
-                "gsc_ctr": round(float(page.get("gsc_ctr", 0.0)), 4),
-                "gsc_position": round(float(page.get("gsc_position", 0.0)), 2),
-                "ga4_sessions": round(float(page.get("ga4_sessions", 0.0)), 2),
-                "ga4_engagement_rate": round(
-                    float(page.get("ga4_engagement_rate", 0.0)), 4
-                ),
-                "ga4_conversion_rate": round(
-                    float(page.get("ga4_conversion_rate", 0.0)), 4
-                ),
-                "gsc_clicks_delta_pct": page.get("gsc_clicks_delta_pct"),
-                "ga4_sessions_delta_pct": page.get("ga4_sessions_delta_pct"),
-            },
-        }
-        items.append(item)
-
-    items.sort(key=lambda i: (i["score"], i["confidence"]), reverse=True)
-    return items[: max(1, limit)]
+    limit = max(1, limit)
+
+    def candidates() -> Iterable[tuple[tuple[float, float], tuple[dict[str, Any], ScoreResult]]]:
+        for page in merged_pages:
+            result = score_page(page, settings)
+            if result.score > 0:
+                yield (result.score, result.confidence), (page, result)
+
+    top, _ = top_ranked(candidates(), limit)
+    return [_action_item(page, result) for page, result in top]
+
+
+def top_ranked(
+    candidates: Iterable[tuple[tuple[float, ...], T]],
+    limit: int,
+) -> tuple[list[T], int]:
+    # Ties keep input order, as in a stable descending sort.
+    heap: list[tuple[tuple[float, ...], int, T]] = []
+    total = 0
+    for rank, item in candidates:
+        entry = (rank, -total, item)
+        total += 1
+        if len(heap) < limit:
+            heapq.heappush(heap, entry)
+        elif entry[:2] > heap[0][:2]:
+            heapq.heapreplace(heap, entry)
+
+    heap.sort(reverse=True)
+    return [item for _, _, item in heap], total
+
+
+def _column(merged_pages: list[dict[str, Any]], field: str) -> list[float]:
+    return [p.get(field, 0.0) for p in merged_pages]
 
 
 def _top(
@@ -142,20 +175,17 @@ def _top(
     field: str,
     top_n: int,
 ) -> list[dict[str, Any]]:
-    rows = sorted(
-        merged_pages,
-        key=lambda p: float(p.get(field, 0.0)),
-        reverse=True,
-    )
+    values = _column(merged_pages, field)
     result: list[dict[str, Any]] = []
-    for row in rows[:top_n]:
+    for i in heapq.nlargest(top_n, range(len(values)), key=values.__getitem__):
+        row = merged_pages[i]
         result.append(
             {
                 "url": row["url"],
-                field: round(float(row.get(field, 0.0)), 4),
-                "gsc_clicks": round(float(row.get("gsc_clicks", 0.0)), 2),
-                "ga4_sessions": round(float(row.get("ga4_sessions", 0.0)), 2),
-                "ga4_conversions": round(float(row.get("ga4_conversions", 0.0)), 2),
+                field: round(values[i], 4),
+                "gsc_clicks": round(row.get("gsc_clicks", 0.0), 2),
+                "ga4_sessions": round(row.get("ga4_sessions", 0.0), 2),
+                "ga4_conversions": round(row.get("ga4_conversions", 0.0), 2),
             }
         )
     return result
@@ -179,35 +209,32 @@ def build_trend_report(
     *,
     top_n: int = 20,
 ) -> dict[str, Any]:
-    click_gainers = sorted(
-        [p for p in merged_pages if isinstance(p.get("gsc_clicks_delta_pct"), (int, float))],
-        key=lambda p: float(p.get("gsc_clicks_delta_pct", 0.0)),
-        reverse=True,
-    )[:top_n]
-
-    click_decliners = sorted(
-        [p for p in merged_pages if isinstance(p.get("gsc_clicks_delta_pct"), (int, float))],
-        key=lambda p: float(p.get("gsc_clicks_delta_pct", 0.0)),
-    )[:top_n]
-
-    session_gainers = sorted(
-        [p for p in merged_pages if isinstance(p.get("ga4_sessions_delta_pct"), (int, float))],
-        key=lambda p: float(p.get("ga4_sessions_delta_pct", 0.0)),
-        reverse=True,
-    )[:top_n]
-
-    session_decliners = sorted(
-        [p for p in merged_pages if isinstance(p.get("ga4_sessions_delta_pct"), (int, float))],
-        key=lambda p: float(p.get("ga4_sessions_delta_pct", 0.0)),
-    )[:top_n]
+    click_deltas: dict[int, float] = {}
+    session_deltas: dict[int, float] = {}
+    for i, p in enumerate(merged_pages):
+        clicks_delta = p.get("gsc_clicks_delta_pct")
+        if clicks_delta is not None:
+            click_deltas[i] = clicks_delta
+        sessions_delta = p.get("ga4_sessions_delta_pct")
+        if sessions_delta is not None:
+            session_deltas[i] = sessions_delta
+
+    def _rank(deltas: dict[int, float], *, largest: bool) -> list[dict[str, Any]]:
+        select = heapq.nlargest if largest else heapq.nsmallest
+        return [merged_pages[i] for i in select(top_n, deltas, key=deltas.__getitem__)]
+
+    click_gainers = _rank(click_deltas, largest=True)
+    click_decliners = _rank(click_deltas, largest=False)
+    session_gainers = _rank(session_deltas, largest=True)
+    session_decliners = _rank(session_deltas, largest=False)
 
     def _pack(rows: list[dict[str, Any]], delta_field: str) -> list[dict[str, Any]]:
         return [
             {
                 "url": row["url"],
-                delta_field: round(float(row.get(delta_field, 0.0)), 4),
-                "gsc_clicks": round(float(row.get("gsc_clicks", 0.0)), 2),
-                "ga4_sessions": round(float(row.get("ga4_sessions", 0.0)), 2),
+                delta_field: round(row.get(delta_field, 0.0), 4),
+                "gsc_clicks": round(row.get("gsc_clicks", 0.0), 2),
+                "ga4_sessions": round(row.get("ga4_sessions", 0.0), 2),
             }
             for row in rows
         ]
@@ -225,54 +252,55 @@ def build_data_quality_report(
     *,
     top_n_unmatched: int = 20,
 ) -> dict[str, Any]:
-    pages_with_gsc = [p for p in merged_pages if float(p.get("gsc_impressions", 0.0)) > 0]
-    pages_with_ga4 = [p for p in merged_pages if float(p.get("ga4_sessions", 0.0)) > 0]
-    pages_with_both = [
-        p
-        for p in merged_pages
-        if float(p.get("gsc_impressions", 0.0)) > 0 and float(p.get("ga4_sessions", 0.0)) > 0
-    ]
-
-    gsc_only = [
-        p
-        for p in merged_pages
-        if float(p.get("gsc_impressions", 0.0)) > 0 and float(p.get("ga4_sessions", 0.0)) <= 0
-    ]
-    ga4_only = [
-        p
-        for p in merged_pages
-        if float(p.get("ga4_sessions", 0.0)) > 0 and float(p.get("gsc_impressions", 0.0)) <= 0
-    ]
-
-    gsc_only_top = sorted(
-        gsc_only, key=lambda p: float(p.get("gsc_impressions", 0.0)), reverse=True
-    )[:top_n_unmatched]
-    ga4_only_top = sorted(
-        ga4_only, key=lambda p: float(p.get("ga4_sessions", 0.0)), reverse=True
-    )[:top_n_unmatched]
+    pages_with_gsc = 0
+    pages_with_ga4 = 0
+    pages_with_both = 0
+    gsc_only: list[dict[str, Any]] = []
+    ga4_only: list[dict[str, Any]] = []
+
+    for p in merged_pages:
+        has_gsc = p.get("gsc_impressions", 0.0) > 0
+        has_ga4 = p.get("ga4_sessions", 0.0) > 0
+        if has_gsc:
+            pages_with_gsc += 1
+        if has_ga4:
+            pages_with_ga4 += 1
+        if has_gsc and has_ga4:
+            pages_with_both += 1
+        elif has_gsc:
+            gsc_only.append(p)
+        elif has_ga4:
+            ga4_only.append(p)
+
+    gsc_only_top = heapq.nlargest(
+        top_n_unmatched, gsc_only, key=lambda p: p.get("gsc_impressions", 0.0)
+    )
+    ga4_only_top = heapq.nlargest(
+        top_n_unmatched, ga4_only, key=lambda p: p.get("ga4_sessions", 0.0)
+    )
 
     return {
         "counts": {
             "total_merged_pages": len(merged_pages),
-            "pages_with_gsc": len(pages_with_gsc),
-            "pages_with_ga4": len(pages_with_ga4),
-            "pages_with_both": len(pages_with_both),
+            "pages_with_gsc": pages_with_gsc,
+            "pages_with_ga4": pages_with_ga4,
+            "pages_with_both": pages_with_both,
             "gsc_only_pages": len(gsc_only),
             "ga4_only_pages": len(ga4_only),
         },
         "top_gsc_only_pages": [
             {
                 "url": p["url"],
-                "gsc_impressions": round(float(p.get("gsc_impressions", 0.0)), 2),
-                "gsc_clicks": round(float(p.get("gsc_clicks", 0.0)), 2),
+                "gsc_impressions": round(p.get("gsc_impressions", 0.0), 2),
+                "gsc_clicks": round(p.get("gsc_clicks", 0.0), 2),
             }
             for p in gsc_only_top
         ],
         "top_ga4_only_pages": [
             {
                 "url": p["url"],
-                "ga4_sessions": round(float(p.get("ga4_sessions", 0.0)), 2),
-                "ga4_conversions": round(float(p.get("ga4_conversions", 0.0)), 2),
+                "ga4_sessions": round(p.get("ga4_sessions", 0.0), 2),
+                "ga4_conversions": round(p.get("ga4_conversions", 0.0), 2),
             }
             for p in ga4_only_top
         ],
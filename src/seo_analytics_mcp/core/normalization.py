@@ -1,8 +1,10 @@
 from __future__ import annotations
 
-from collections import defaultdict
+import sys
+from functools import lru_cache
+from operator import itemgetter
 from typing import Any, Sequence
-from urllib.parse import urljoin, urlsplit, urlunsplit
+from urllib.parse import urljoin, urlsplit
 
 
 def to_float(value: Any, default: float = 0.0) -> float:
@@ -23,6 +25,36 @@ def to_int(value: Any, default: int = 0) -> int:
         return default
 
 
+_SLOW_URL_CHARS = frozenset("?#[]\t\r\n")
+_JOIN_SLOW_CHARS = _SLOW_URL_CHARS | {":", ";"}
+
+
+@lru_cache(maxsize=64)
+def _join_prefix(base_url: str) -> str | None:
+    prefix = base_url.rstrip("/") + "/"
+    if not prefix.startswith(("http://", "https://")):
+        return None
+    rest = prefix.split("://", 1)[1]
+    if not rest.split("/", 1)[0] or _SLOW_URL_CHARS.intersection(rest):
+        return None
+    if ";" in rest or "//" in rest or "/." in rest:
+        return None
+    return prefix
+
+
+def _is_plain_relative(path: str) -> bool:
+    # True when urljoin would leave ``path`` as-is.
+    if not path:
+        return True
+    if path[0] <= " " or path[0] == ".":
+        return False
+    return (
+        "/." not in path
+        and "//" not in path
+        and not _JOIN_SLOW_CHARS.intersection(path)
+    )
+
+
 def normalize_url(
     value: str,
     *,
@@ -30,32 +62,64 @@ def normalize_url(
     drop_query: bool = True,
     drop_fragment: bool = True,
     remove_www: bool = False,
+) -> str:
+    return _normalize_url(value, base_url, drop_query, drop_fragment, remove_www)
+
+
+@lru_cache(maxsize=1 << 16)
+def _normalize_url(
+    value: str,
+    base_url: str | None,
+    drop_query: bool,
+    drop_fragment: bool,
+    remove_www: bool,
 ) -> str:
     text = (value or "").strip()
     if not text:
         return text
 
+    # Already-canonical absolute URLs come back from urlsplit/urlunsplit unchanged.
+    if (
+        text.startswith("https://")
+        and text.find("/", 8) > 8
+        and not text.endswith("/")
+        and text.isascii()
+        and text.islower()
+        and not _SLOW_URL_CHARS.intersection(text)
+        and not (remove_www and text.startswith("https://www."))
+    ):
+        return text
+
     if not text.startswith(("http://", "https://")) and base_url:
-        text = urljoin(base_url.rstrip("/") + "/", text.lstrip("/"))
+        relative = text.lstrip("/")
+        prefix = _join_prefix(base_url)
+        if prefix is not None and _is_plain_relative(relative):
+            text = prefix + relative
+        else:
+            text = urljoin(base_url.rstrip("/") + "/", relative)
 
     parts = urlsplit(text)
 
     scheme = parts.scheme.lower() or "https"
     netloc = parts.netloc.lower()
-    if remove_www and netloc.startswith("www."):
+    if remove_www and netloc[:4] == "www.":
         netloc = netloc[4:]
 
-    path = parts.path or "/"
-    if len(path) > 1 and path.endswith("/"):
+    path = parts.path
+    if not path:
+        path = "/"
+    elif len(path) > 1 and path[-1] == "/":
         path = path[:-1]
 
-    query = "" if drop_query else parts.query
-    fragment = "" if drop_fragment else parts.fragment
-
     if not netloc:
         return path
 
-    return urlunsplit((scheme, netloc, path, query, fragment))
+    url = f"{scheme}://{netloc}{path}"
+    if not drop_query and parts.query:
+        url += "?" + parts.query
+    if not drop_fragment and parts.fragment:
+        url += "#" + parts.fragment
+    return url
 
 
 def _weighted_average(sum_weighted: float, sum_weight: float, fallback: float = 0.0) -> float:
@@ -64,6 +128,27 @@ def _weighted_average(sum_weighted: float, sum_weight: float, fallback: float =
     return sum_weighted / sum_weight
 
 
+_gsc_metrics = itemgetter("clicks", "impressions", "ctr", "position")
+
+
+def gsc_row_metrics(row: dict[str, Any]) -> tuple[float, float, float, float]:
+    try:
+        clicks, impressions, ctr, position = _gsc_metrics(row)
+        return (
+            float(clicks or 0.0),
+            float(impressions or 0.0),
+            float(ctr or 0.0),
+            float(position or 0.0),
+        )
+    except (KeyError, TypeError, ValueError):
+        return (
+            to_float(row.get("clicks")),
+            to_float(row.get("impressions")),
+            to_float(row.get("ctr")),
+            to_float(row.get("position")),
+        )
+
+
 def normalize_gsc_rows_by_page(
     rows: Sequence[dict[str, Any]],
     *,
@@ -76,15 +161,12 @@ def normalize_gsc_rows_by_page(
     else:
         page_index = 0
 
-    bucket: dict[str, dict[str, Any]] = defaultdict(
-        lambda: {
-            "gsc_clicks": 0.0,
-            "gsc_impressions": 0.0,
-            "gsc_ctr_weighted": 0.0,
-            "gsc_position_weighted": 0.0,
-            "gsc_rows": 0,
-        }
-    )
+    index: dict[str, int] = {}
+    clicks_sum: list[float] = []
+    impressions_sum: list[float] = []
+    ctr_weighted: list[float] = []
+    position_weighted: list[float] = []
+    row_counts: list[int] = []
 
     for row in rows:
         keys = row.get("keys", [])
@@ -94,30 +176,39 @@ def normalize_gsc_rows_by_page(
             continue
 
         raw_url = str(keys[page_index])
-        url = normalize_url(raw_url, base_url=base_url)
+        url = sys.intern(_normalize_url(raw_url, base_url, True, True, False))
         if not url:
             continue
 
-        clicks = to_float(row.get("clicks"))
-        impressions = to_float(row.get("impressions"))
-        ctr = to_float(row.get("ctr"))
-        position = to_float(row.get("position"))
-
-        item = bucket[url]
-        item["gsc_clicks"] += clicks
-        item["gsc_impressions"] += impressions
-        item["gsc_ctr_weighted"] += ctr * impressions
-        item["gsc_position_weighted"] += position * impressions
-        item["gsc_rows"] += 1
-
-    for url, item in bucket.items():
-        impressions = item["gsc_impressions"]
-        item["gsc_ctr"] = _weighted_average(item["gsc_ctr_weighted"], impressions)
-        item["gsc_position"] = _weighted_average(item["gsc_position_weighted"], impressions)
-        del item["gsc_ctr_weighted"]
-        del item["gsc_position_weighted"]
+        clicks, impressions, ctr, position = gsc_row_metrics(row)
+
+        i = index.get(url)
+        if i is None:
+            i = index[url] = len(row_counts)
+            clicks_sum.append(0.0)
+            impressions_sum.append(0.0)
+            ctr_weighted.append(0.0)
+            position_weighted.append(0.0)
+            row_counts.append(0)
+
+        clicks_sum[i] += clicks
+        impressions_sum[i] += impressions
+        ctr_weighted[i] += ctr * impressions
+        position_weighted[i] += position * impressions
+        row_counts[i] += 1
+
+    result: dict[str, dict[str, Any]] = {}
+    for url, i in index.items():
+        impressions = impressions_sum[i]
+        result[url] = {
+            "gsc_clicks": clicks_sum[i],
+            "gsc_impressions": impressions,
+            "gsc_rows": row_counts[i],
+            "gsc_ctr": _weighted_average(ctr_weighted[i], impressions),
+            "gsc_position": _weighted_average(position_weighted[i], impressions),
+        }
 
-    return dict(bucket)
+    return result
 
 
 def normalize_ga4_rows_by_page(
@@ -137,17 +228,7 @@ def normalize_ga4_rows_by_page(
         ]
     )
 
-    bucket: dict[str, dict[str, Any]] = defaultdict(
-        lambda: {
-            "ga4_sessions": 0.0,
-            "ga4_engaged_sessions": 0.0,
-            "ga4_conversions": 0.0,
-            "ga4_total_users": 0.0,
-            "ga4_screen_page_views": 0.0,
-            "ga4_user_engagement_duration": 0.0,
-            "ga4_rows": 0,
-        }
-    )
+    bucket: dict[str, dict[str, Any]] = {}
 
     for row in rows:
         raw = None
@@ -159,19 +240,42 @@ def normalize_ga4_rows_by_page(
         if not raw:
             continue
 
-        url = normalize_url(raw, base_url=base_url)
+        url = sys.intern(_normalize_url(raw, base_url, True, True, False))
         if not url:
             continue
 
-        item = bucket[url]
-        item["ga4_sessions"] += to_float(row.get("sessions"))
-        item["ga4_engaged_sessions"] += to_float(row.get("engagedSessions"))
-        item["ga4_conversions"] += to_float(row.get("conversions"))
-        item["ga4_total_users"] += to_float(row.get("totalUsers"))
-        item["ga4_screen_page_views"] += to_float(row.get("screenPageViews"))
-        item["ga4_user_engagement_duration"] += to_float(
-            row.get("userEngagementDuration")
-        )
+        try:
+            sessions = float(row.get("sessions") or 0.0)
+            engaged_sessions = float(row.get("engagedSessions") or 0.0)
+            conversions = float(row.get("conversions") or 0.0)
+            total_users = float(row.get("totalUsers") or 0.0)
+            screen_page_views = float(row.get("screenPageViews") or 0.0)
+            engagement_duration = float(row.get("userEngagementDuration") or 0.0)
+        except (TypeError, ValueError):
+            sessions = to_float(row.get("sessions"))
+            engaged_sessions = to_float(row.get("engagedSessions"))
+            conversions = to_float(row.get("conversions"))
+            total_users = to_float(row.get("totalUsers"))
+            screen_page_views = to_float(row.get("screenPageViews"))
+            engagement_duration = to_float(row.get("userEngagementDuration"))
+
+        item = bucket.get(url)
+        if item is None:
+            bucket[url] = item = {
+                "ga4_sessions": 0.0,
+                "ga4_engaged_sessions": 0.0,
+                "ga4_conversions": 0.0,
+                "ga4_total_users": 0.0,
+                "ga4_screen_page_views": 0.0,
+                "ga4_user_engagement_duration": 0.0,
+                "ga4_rows": 0,
+            }
+        item["ga4_sessions"] += sessions
+        item["ga4_engaged_sessions"] += engaged_sessions
+        item["ga4_conversions"] += conversions
+        item["ga4_total_users"] += total_users
+        item["ga4_screen_page_views"] += screen_page_views
+        item["ga4_user_engagement_duration"] += engagement_duration
         item["ga4_rows"] += 1
 
     for item in bucket.values():
@@ -183,7 +287,7 @@ def normalize_ga4_rows_by_page(
             item["ga4_conversions"] / sessions if sessions > 0 else 0.0
         )
 
-    return dict(bucket)
+    return bucket
 
 
 def compute_delta_pct(current: float, previous: float) -> float | None:
@@ -7,7 +7,7 @@ from typing import Any
 from seo_analytics_mcp.config import Settings
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ScoreResult:
     score: float
     categories: list[str]
@@ -46,7 +46,21 @@ def _effort(categories: list[str]) -> str:
 def _log_scale(value: float, multiplier: float = 8.0) -> float:
     if value <= 0:
         return 0.0
-    return min(20.0, math.log10(value + 1.0) * multiplier)
+    scaled = math.log10(value + 1.0) * multiplier
+    return scaled if scaled < 20.0 else 20.0
+
+
+def _no_score() -> ScoreResult:
+    return ScoreResult(
+        score=0.0,
+        categories=[],
+        reasons=[],
+        recommendations=[],
+        priority="low",
+        expected_impact="low",
+        effort="low",
+        confidence=0.0,
+    )
 
 
 def score_page(page: dict[str, Any], settings: Settings) -> ScoreResult:
@@ -67,8 +81,27 @@ def score_page(page: dict[str, Any], settings: Settings) -> ScoreResult:
     clicks_delta = page.get("gsc_clicks_delta_pct")
     sessions_delta = page.get("ga4_sessions_delta_pct")
 
-    if impressions >= settings.min_impressions_for_ctr_action and ctr < settings.target_ctr:
-        ctr_gap = (settings.target_ctr - ctr) / max(settings.target_ctr, 1e-6)
+    target_ctr = settings.target_ctr
+    target_conversion_rate = settings.target_conversion_rate
+    min_impressions = settings.min_impressions_for_ctr_action
+    min_sessions = settings.min_sessions_for_conversion_action
+
+    has_search_volume = impressions >= min_impressions
+    has_session_volume = sessions >= min_sessions
+    clicks_declined = clicks_delta is not None and clicks_delta <= -0.2
+    sessions_declined = sessions_delta is not None and sessions_delta <= -0.2
+
+    if not (
+        impressions > 0
+        or has_search_volume
+        or has_session_volume
+        or clicks_declined
+        or sessions_declined
+    ):
+        return _no_score()
+
+    if has_search_volume and ctr < target_ctr:
+        ctr_gap = (target_ctr - ctr) / max(target_ctr, 1e-6)
         ctr_score = min(45.0, ctr_gap * 45.0 + _log_scale(impressions, 6.0))
         score += ctr_score
         categories.append("ctr_optimization")
@@ -82,9 +115,9 @@ def score_page(page: dict[str, Any], settings: Settings) -> ScoreResult:
             ]
         )
 
-    if sessions >= settings.min_sessions_for_conversion_action and conversion_rate < settings.target_conversion_rate:
-        cr_gap = (settings.target_conversion_rate - conversion_rate) / max(
-            settings.target_conversion_rate,
+    if has_session_volume and conversion_rate < target_conversion_rate:
+        cr_gap = (target_conversion_rate - conversion_rate) / max(
+            target_conversion_rate,
             1e-6,
         )
         cr_score = min(45.0, cr_gap * 42.0 + _log_scale(sessions, 6.0))
@@ -100,7 +133,7 @@ def score_page(page: dict[str, Any], settings: Settings) -> ScoreResult:
             ]
         )
 
-    if isinstance(clicks_delta, (int, float)) and clicks_delta <= -0.2:
+    if clicks_declined:
         drop_score = min(30.0, abs(clicks_delta) * 60.0)
         score += drop_score
         categories.append("content_refresh")
@@ -109,7 +142,7 @@ def score_page(page: dict[str, Any], settings: Settings) -> ScoreResult:
             "Refresh outdated sections and compare SERP competitors for intent drift."
         )
 
-    if isinstance(sessions_delta, (int, float)) and sessions_delta <= -0.2:
+    if sessions_declined:
         drop_score = min(30.0, abs(sessions_delta) * 55.0)
         score += drop_score
         categories.append("content_refresh")
@@ -119,10 +152,10 @@ def score_page(page: dict[str, Any], settings: Settings) -> ScoreResult:
         )
 
     if (
-        impressions >= settings.min_impressions_for_ctr_action
-        and sessions >= settings.min_sessions_for_conversion_action
-        and ctr >= settings.target_ctr
-        and conversion_rate >= settings.target_conversion_rate
+        has_search_volume
+        and has_session_volume
+        and ctr >= target_ctr
+        and conversion_rate >= target_conversion_rate
     ):
         scale_score = min(35.0, _log_scale(clicks + sessions, 7.0) + 10.0)
         score += scale_score
@@ -140,20 +173,9 @@ def score_page(page: dict[str, Any], settings: Settings) -> ScoreResult:
         reasons.append("Average position indicates page may be near page-one threshold.")
 
     if not categories and score <= 0:
-        return ScoreResult(
-            score=0.0,
-            categories=[],
-            reasons=[],
-            recommendations=[],
-            priority="low",
-            expected_impact="low",
-            effort="low",
-            confidence=0.0,
-        )
+        return _no_score()
 
     unique_categories = sorted(set(categories))
-    unique_reasons = list(dict.fromkeys(reasons))
-    unique_recommendations = list(dict.fromkeys(recommendations))
 
     sources = 0
     if impressions > 0:
@@ -172,8 +194,8 @@ def score_page(page: dict[str, Any], settings: Settings) -> ScoreResult:
     return ScoreResult(
         score=round(score, 2),
         categories=unique_categories,
-        reasons=unique_reasons,
-        recommendations=unique_recommendations,
+        reasons=reasons,
+        recommendations=recommendations,
         priority=_priority_from_score(score),
         expected_impact=_expected_impact(score),
         effort=_effort(unique_categories),
@@ -1,13 +1,23 @@
 from __future__ import annotations
 
+import asyncio
+import heapq
+import json
+import re
+import sys
+import threading
 from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import date, timedelta
+from functools import lru_cache
+from operator import itemgetter
 from urllib.parse import urlparse
-from typing import Any
+from typing import Any, Callable, Iterable, Iterator, Sequence, TypeVar
 
 from dotenv import load_dotenv
 from mcp.server.fastmcp import FastMCP
 
+from seo_analytics_mcp.cache import DiskCache, ResponseCache
 from seo_analytics_mcp.config import Settings, current_and_previous_ranges, load_settings
 from seo_analytics_mcp.connectors.ga4 import GA4Connector
 from seo_analytics_mcp.connectors.gsc import GSCConnector
@@ -18,20 +28,107 @@ from seo_analytics_mcp.core.analysis import (
     generate_action_items,
     merge_page_metrics,
     summarize_portfolio,
+    top_ranked,
 )
 from seo_analytics_mcp.core.normalization import (
+    gsc_row_metrics,
     normalize_ga4_rows_by_page,
     normalize_gsc_rows_by_page,
     normalize_url,
     to_float,
 )
 
+T = TypeVar("T")
+
 load_dotenv()
 
 mcp = FastMCP("seo-analytics-mcp")
 _settings = load_settings()
 _gsc_connector: GSCConnector | None = None
 _ga4_connector: GA4Connector | None = None
+_connector_lock = threading.Lock()
+
+# Thread policy: tools run on asyncio's default executor; each thread that starts a
+# report fetches its first page itself, and later pages go to the shared pagination
+# pool (PAGE_FETCH_WORKERS). _fetch_page_data starts its reports on this pool, kept
+# separate because these workers block on the pagination pool. Worst case upstream
+# concurrency is REPORT_FETCH_WORKERS + PAGE_FETCH_WORKERS, plus one first-page
+# request per other tool call in flight.
+REPORT_FETCH_WORKERS = 4
+_fetch_executor = ThreadPoolExecutor(
+    max_workers=REPORT_FETCH_WORKERS,
+    thread_name_prefix="seo-analytics-fetch",
+)
+
+_response_cache = ResponseCache(
+    _settings.response_cache_ttl_seconds,
+    _settings.response_cache_max_rows,
+)
+_disk_cache = DiskCache(
+    _settings.disk_cache_dir,
+    _settings.disk_cache_max_mb * 1024 * 1024,
+)
+# Bumped whenever a cached value's shape changes, so older disk entries are not reused.
+_CACHE_FORMAT_VERSION = 1
+_FINALIZED_RANGE_TTL_SECONDS = 24 * 60 * 60
+_OPEN_RANGE_TTL_SECONDS = 60 * 60
+# Search Console keeps revising the most recent days' data.
+_OPEN_RANGE_DAYS = 3
+
+_GA4_PAGE_METRICS = (
+    "sessions",
+    "engagedSessions",
+    "conversions",
+    "totalUsers",
+    "screenPageViews",
+    "userEngagementDuration",
+)
+
+_GSC_ROW_FIELDS = (
+    ("clicks", "clicks", 2),
+    ("impressions", "impressions", 2),
+    ("ctr", "ctr", 4),
+    ("position", "position", 2),
+)
+_GSC_PAGE_FIELDS = (
+    ("clicks", "gsc_clicks", 2),
+    ("impressions", "gsc_impressions", 2),
+    ("ctr", "gsc_ctr", 4),
+    ("position", "gsc_position", 2),
+)
+_GA4_PAGE_FIELDS = (
+    ("sessions", "ga4_sessions", 2),
+    ("engaged_sessions", "ga4_engaged_sessions", 2),
+    ("engagement_rate", "ga4_engagement_rate", 4),
+    ("conversions", "ga4_conversions", 2),
+    ("conversion_rate", "ga4_conversion_rate", 4),
+    ("total_users", "ga4_total_users", 2),
+    ("screen_page_views", "ga4_screen_page_views", 2),
+    ("user_engagement_duration", "ga4_user_engagement_duration", 2),
+)
+
+_TOPIC_TOKEN_RE = re.compile(r"[^\s-]{3,}")
+_TOPIC_STOP_WORDS = frozenset(
+    {
+        "the",
+        "a",
+        "an",
+        "to",
+        "of",
+        "for",
+        "in",
+        "on",
+        "with",
+        "and",
+        "or",
+        "is",
+        "are",
+        "what",
+        "how",
+        "why",
+        "when",
+    }
+)
 
 
 def _get_settings() -> Settings:
@@ -44,7 +141,9 @@ def _get_gsc_connector() -> GSCConnector:
     if not settings.enable_gsc:
         raise RuntimeError("GSC connector is disabled. Set ENABLE_GSC=true.")
     if _gsc_connector is None:
-        _gsc_connector = GSCConnector()
+        with _connector_lock:
+            if _gsc_connector is None:
+                _gsc_connector = GSCConnector()
     return _gsc_connector
 
 
@@ -54,10 +153,104 @@ def _get_ga4_connector() -> GA4Connector:
     if not settings.enable_ga4:
         raise RuntimeError("GA4 connector is disabled. Set ENABLE_GA4=true.")
     if _ga4_connector is None:
-        _ga4_connector = GA4Connector()
+        with _connector_lock:
+            if _ga4_connector is None:
+                _ga4_connector = GA4Connector()
     return _ga4_connector
 
 
+def _cached(
+    key: tuple[Any, ...],
+    end_date: str,
+    fetch: Callable[[], T],
+    weigh: Callable[[T], int],
+) -> T:
+    # Memory first, then disk. Ranges reaching the last few days can still change
+    # upstream, so they are kept on disk for a shorter time than finalized ones.
+    key = (_CACHE_FORMAT_VERSION, *key)
+    if end_date >= (date.today() - timedelta(days=_OPEN_RANGE_DAYS)).isoformat():
+        disk_ttl = _OPEN_RANGE_TTL_SECONDS
+    else:
+        disk_ttl = _FINALIZED_RANGE_TTL_SECONDS
+    return _response_cache.get_or_fetch(
+        key, lambda: _disk_cache.get_or_fetch(key, fetch, disk_ttl), weigh
+    )
+
+
+def _cached_report(
+    fetch: Callable[..., dict[str, Any]],
+    site_or_property: str,
+    start_date: str,
+    end_date: str,
+    **kwargs: Any,
+) -> dict[str, Any]:
+    key = (
+        fetch.__qualname__,
+        fetch.__self__.credentials_id,  # type: ignore[attr-defined]
+        (site_or_property, start_date, end_date),
+        json.dumps(kwargs, sort_keys=True),
+    )
+    return _cached(
+        key,
+        end_date,
+        lambda: fetch(site_or_property, start_date, end_date, **kwargs),
+        lambda report: len(report["rows"]),
+    )
+
+
+def _ga4_pages(
+    ga4: GA4Connector,
+    property_id: str,
+    start_date: str,
+    end_date: str,
+    *,
+    max_rows: int,
+) -> dict[str, dict[str, Any]]:
+    # Shared, post-normalization, by every tool reading GA4 page data.
+    base_url = _get_settings().canonical_base_url
+
+    def fetch() -> dict[str, dict[str, Any]]:
+        report = ga4.run_report_all(
+            property_id,
+            start_date,
+            end_date,
+            dimensions=["landingPagePlusQueryString"],
+            metrics=list(_GA4_PAGE_METRICS),
+            order_bys=[{"metric": "sessions", "desc": True}],
+            max_rows=max_rows,
+        )
+        return normalize_ga4_rows_by_page(report["rows"], base_url=base_url)
+
+    key = (
+        "ga4_pages",
+        ga4.credentials_id,
+        property_id,
+        start_date,
+        end_date,
+        max_rows,
+        base_url,
+    )
+    return _cached(key, end_date, fetch, len)
+
+
+def _materialize_rows(
+    items: Iterable[tuple[dict[str, Any], dict[str, Any]]],
+    field_specs: Sequence[tuple[str, str, int]],
+) -> list[dict[str, Any]]:
+    rows: list[dict[str, Any]] = []
+    for row, source in items:
+        for name, key, ndigits in field_specs:
+            row[name] = round(to_float(source.get(key)), ndigits)
+        rows.append(row)
+    return rows
+
+
+@lru_cache(maxsize=1 << 16)
+def _topic_tokens(query: str) -> frozenset[str]:
+    return frozenset(map(sys.intern, _TOPIC_TOKEN_RE.findall(query))) - _TOPIC_STOP_WORDS
+
+
+@lru_cache(maxsize=64)
 def _normalize_gsc_site_url(value: str) -> str:
     raw = value.strip()
     if not raw:
@@ -127,97 +320,75 @@ def _fetch_page_data(
 ) -> dict[str, Any]:
     settings = _get_settings()
     current_start, current_end = _default_dates(start_date, end_date)
-    ranges = current_and_previous_ranges(current_start, current_end, settings.default_lookback_days)
-
-    # Ensure current range reflects explicit values.
-    ranges["current"] = (current_start, current_end)
-
-    gsc_current: dict[str, dict[str, Any]] = {}
-    gsc_previous: dict[str, dict[str, Any]] = {}
-    ga4_current: dict[str, dict[str, Any]] = {}
-    ga4_previous: dict[str, dict[str, Any]] = {}
+    if include_previous_period:
+        ranges = current_and_previous_ranges(
+            current_start, current_end, settings.default_lookback_days
+        )
+        # Ensure current range reflects explicit values.
+        ranges["current"] = (current_start, current_end)
+    else:
+        ranges = {"current": (current_start, current_end)}
 
     resolved_site_url: str | None = site_url or settings.default_gsc_site_url
     resolved_property_id = property_id or settings.default_ga4_property_id
 
+    futures: dict[str, Future[dict[str, dict[str, Any]]]] = {}
+
     if settings.enable_gsc:
         resolved_site_url = _resolve_site_url(site_url)
         gsc = _get_gsc_connector()
-        current_resp = gsc.search_analytics_all(
-            resolved_site_url,
-            ranges["current"][0],
-            ranges["current"][1],
-            dimensions=["page"],
-            search_type="web",
-            aggregation_type="byPage",
-            max_rows=max_rows,
-        )
-        gsc_current = normalize_gsc_rows_by_page(
-            current_resp["rows"],
-            dimensions=["page"],
-            base_url=settings.canonical_base_url,
-        )
-
-        if include_previous_period:
-            prev_resp = gsc.search_analytics_all(
-                resolved_site_url,
-                ranges["previous"][0],
-                ranges["previous"][1],
+        gsc_site_url = resolved_site_url
+
+        def fetch_gsc(period: str) -> dict[str, dict[str, Any]]:
+            response = _cached_report(
+                gsc.search_analytics_all,
+                gsc_site_url,
+                ranges[period][0],
+                ranges[period][1],
                 dimensions=["page"],
                 search_type="web",
                 aggregation_type="byPage",
                 max_rows=max_rows,
             )
-            gsc_previous = normalize_gsc_rows_by_page(
-                prev_resp["rows"],
+            return normalize_gsc_rows_by_page(
+                response["rows"],
                 dimensions=["page"],
                 base_url=settings.canonical_base_url,
             )
 
+        futures["gsc_current"] = _fetch_executor.submit(fetch_gsc, "current")
+        if include_previous_period:
+            futures["gsc_previous"] = _fetch_executor.submit(fetch_gsc, "previous")
+
     if settings.enable_ga4 and resolved_property_id:
         ga4 = _get_ga4_connector()
-        common_kwargs: dict[str, Any] = {
-            "dimensions": ["landingPagePlusQueryString"],
-            "metrics": [
-                "sessions",
-                "engagedSessions",
-                "conversions",
-                "totalUsers",
-                "screenPageViews",
-                "userEngagementDuration",
-            ],
-            "order_bys": [{"metric": "sessions", "desc": True}],
-            "max_rows": max_rows,
-        }
-
-        current_resp = ga4.run_report_all(
-            resolved_property_id,
-            ranges["current"][0],
-            ranges["current"][1],
-            **common_kwargs,
-        )
-        ga4_current = normalize_ga4_rows_by_page(
-            current_resp["rows"],
-            base_url=settings.canonical_base_url,
-        )
+        ga4_property_id = resolved_property_id
+
+        def fetch_ga4(period: str) -> dict[str, dict[str, Any]]:
+            return _ga4_pages(
+                ga4,
+                ga4_property_id,
+                ranges[period][0],
+                ranges[period][1],
+                max_rows=max_rows,
+            )
 
+        futures["ga4_current"] = _fetch_executor.submit(fetch_ga4, "current")
         if include_previous_period:
-            prev_resp = ga4.run_report_all(
-                resolved_property_id,
-                ranges["previous"][0],
-                ranges["previous"][1],
-                **common_kwargs,
-            )
-            ga4_previous = normalize_ga4_rows_by_page(
-                prev_resp["rows"],
-                base_url=settings.canonical_base_url,
-            )
+            futures["ga4_previous"] = _fetch_executor.submit(fetch_ga4, "previous")
+
+    def collect(key: str) -> dict[str, dict[str, Any]]:
+        future = futures.get(key)
+        return future.result() if future is not None else {}
+
+    gsc_current = collect("gsc_current")
+    ga4_current = collect("ga4_current")
 
     merged = merge_page_metrics(
         gsc_current,
         ga4_current,
-        gsc_previous=gsc_previous if include_previous_period else None,
-        ga4_previous=ga4_previous if include_previous_period else None,
+        gsc_previous=collect("gsc_previous"),
+        ga4_previous=collect("ga4_previous"),
     )
 
     return {
@@ -248,6 +419,10 @@ def capabilities() -> dict[str, Any]:
             "ga4_property_id": settings.default_ga4_property_id,
             "lookback_days": settings.default_lookback_days,
             "canonical_base_url": settings.canonical_base_url,
+            "response_cache_ttl_seconds": settings.response_cache_ttl_seconds,
+            "response_cache_max_rows": settings.response_cache_max_rows,
+            "disk_cache_enabled": settings.disk_cache_dir is not None,
+            "disk_cache_max_mb": settings.disk_cache_max_mb,
             "require_explicit_gsc_site_url": settings.require_explicit_gsc_site_url,
         },
         "analysis_thresholds": {
@@ -341,7 +516,8 @@ def gsc_top_pages(
     resolved_site = _resolve_site_url(site_url)
     resolved_start, resolved_end = _default_dates(start_date, end_date)
 
-    response = connector.search_analytics_all(
+    response = _cached_report(
+        connector.search_analytics_all,
         resolved_site,
         resolved_start,
         resolved_end,
@@ -357,24 +533,23 @@ def gsc_top_pages(
         base_url=settings.canonical_base_url,
     )
 
-    rows = [
-        {
-            "url": url,
-            "clicks": round(float(item.get("gsc_clicks", 0.0)), 2),
-            "impressions": round(float(item.get("gsc_impressions", 0.0)), 2),
-            "ctr": round(float(item.get("gsc_ctr", 0.0)), 4),
-            "position": round(float(item.get("gsc_position", 0.0)), 2),
-        }
-        for url, item in pages.items()
-    ]
-    rows.sort(key=lambda r: r["clicks"], reverse=True)
+    # Ranked on the rounded value so ties keep their order.
+    top_pages = heapq.nlargest(
+        max(1, top_n),
+        pages.items(),
+        key=lambda entry: round(entry[1].get("gsc_clicks", 0.0), 2),
+    )
+    rows = _materialize_rows(
+        (({"url": url}, item) for url, item in top_pages),
+        _GSC_PAGE_FIELDS,
+    )
 
     return {
         "site_url": resolved_site,
         "start_date": resolved_start,
         "end_date": resolved_end,
-        "total_pages": len(rows),
-        "rows": rows[: max(1, top_n)],
+        "total_pages": len(pages),
+        "rows": rows,
     }
 
 
@@ -392,7 +567,8 @@ def gsc_top_queries(
     resolved_site = _resolve_site_url(site_url)
     resolved_start, resolved_end = _default_dates(start_date, end_date)
 
-    response = connector.search_analytics_all(
+    response = _cached_report(
+        connector.search_analytics_all,
         resolved_site,
         resolved_start,
         resolved_end,
@@ -401,29 +577,25 @@ def gsc_top_queries(
         max_rows=max_rows,
     )
 
-    rows: list[dict[str, Any]] = []
-    for row in response["rows"]:
-        keys = row.get("keys", [])
-        if not keys:
-            continue
-        rows.append(
-            {
-                "query": keys[0],
-                "clicks": round(to_float(row.get("clicks")), 2),
-                "impressions": round(to_float(row.get("impressions")), 2),
-                "ctr": round(to_float(row.get("ctr")), 4),
-                "position": round(to_float(row.get("position")), 2),
-            }
-        )
-
-    rows.sort(key=lambda r: r["clicks"], reverse=True)
+    top_rows, total_queries = top_ranked(
+        (
+            ((round(to_float(row.get("clicks")), 2),), row)
+            for row in response["rows"]
+            if row.get("keys")
+        ),
+        max(1, top_n),
+    )
+    rows = _materialize_rows(
+        (({"query": row["keys"][0]}, row) for row in top_rows),
+        _GSC_ROW_FIELDS,
+    )
 
     return {
         "site_url": resolved_site,
         "start_date": resolved_start,
         "end_date": resolved_end,
-        "total_queries": len(rows),
-        "rows": rows[: max(1, top_n)],
+        "total_queries": total_queries,
+        "rows": rows,
     }
 
 
@@ -441,7 +613,8 @@ def gsc_query_page_pairs(
     resolved_site = _resolve_site_url(site_url)
     resolved_start, resolved_end = _default_dates(start_date, end_date)
 
-    response = connector.search_analytics_all(
+    response = _cached_report(
+        connector.search_analytics_all,
         resolved_site,
         resolved_start,
         resolved_end,
@@ -450,30 +623,25 @@ def gsc_query_page_pairs(
         max_rows=max_rows,
     )
 
-    rows: list[dict[str, Any]] = []
-    for row in response["rows"]:
-        keys = row.get("keys", [])
-        if len(keys) < 2:
-            continue
-        rows.append(
-            {
-                "query": keys[0],
-                "page": keys[1],
-                "clicks": round(to_float(row.get("clicks")), 2),
-                "impressions": round(to_float(row.get("impressions")), 2),
-                "ctr": round(to_float(row.get("ctr")), 4),
-                "position": round(to_float(row.get("position")), 2),
-            }
-        )
-
-    rows.sort(key=lambda r: (r["impressions"], r["clicks"]), reverse=True)
+    def candidates() -> Iterator[tuple[tuple[float, float], dict[str, Any]]]:
+        for row in response["rows"]:
+            if len(row.get("keys", [])) < 2:
+                continue
+            clicks, impressions, _, _ = gsc_row_metrics(row)
+            yield (round(impressions, 2), round(clicks, 2)), row
+
+    top_rows, total_pairs = top_ranked(candidates(), max(1, top_n))
+    rows = _materialize_rows(
+        (({"query": row["keys"][0], "page": row["keys"][1]}, row) for row in top_rows),
+        _GSC_ROW_FIELDS,
+    )
 
     return {
         "site_url": resolved_site,
         "start_date": resolved_start,
         "end_date": resolved_end,
-        "total_pairs": len(rows),
-        "rows": rows[: max(1, top_n)],
+        "total_pairs": total_pairs,
+        "rows": rows,
     }
 
 
@@ -532,56 +700,33 @@ def ga4_landing_pages(
 ) -> dict[str, Any]:
     """Return GA4 landing pages with engagement and conversion metrics."""
     connector = _get_ga4_connector()
-    settings = _get_settings()
     resolved_property = _resolve_property_id(property_id)
     resolved_start, resolved_end = _default_dates(start_date, end_date)
 
-    report = connector.run_report_all(
+    pages = _ga4_pages(
+        connector,
         resolved_property,
         resolved_start,
         resolved_end,
-        dimensions=["landingPagePlusQueryString"],
-        metrics=[
-            "sessions",
-            "engagedSessions",
-            "conversions",
-            "totalUsers",
-            "screenPageViews",
-            "userEngagementDuration",
-        ],
-        order_bys=[{"metric": "sessions", "desc": True}],
         max_rows=max_rows,
     )
 
-    pages = normalize_ga4_rows_by_page(
-        report["rows"],
-        base_url=settings.canonical_base_url,
+    top_pages = heapq.nlargest(
+        max(1, top_n),
+        pages.items(),
+        key=lambda entry: round(entry[1].get("ga4_sessions", 0.0), 2),
+    )
+    rows = _materialize_rows(
+        (({"url": url}, item) for url, item in top_pages),
+        _GA4_PAGE_FIELDS,
     )
-
-    rows = [
-        {
-            "url": url,
-            "sessions": round(float(item.get("ga4_sessions", 0.0)), 2),
-            "engaged_sessions": round(float(item.get("ga4_engaged_sessions", 0.0)), 2),
-            "engagement_rate": round(float(item.get("ga4_engagement_rate", 0.0)), 4),
-            "conversions": round(float(item.get("ga4_conversions", 0.0)), 2),
-            "conversion_rate": round(float(item.get("ga4_conversion_rate", 0.0)), 4),
-            "total_users": round(float(item.get("ga4_total_users", 0.0)), 2),
-            "screen_page_views": round(float(item.get("ga4_screen_page_views", 0.0)), 2),
-            "user_engagement_duration": round(
-                float(item.get("ga4_user_engagement_duration", 0.0)), 2
-            ),
-        }
-        for url, item in pages.items()
-    ]
-    rows.sort(key=lambda r: r["sessions"], reverse=True)
 
     return {
         "property_id": resolved_property,
         "start_date": resolved_start,
         "end_date": resolved_end,
-        "total_pages": len(rows),
-        "rows": rows[: max(1, top_n)],
+        "total_pages": len(pages),
+        "rows": rows,
     }
 
 
@@ -607,7 +752,8 @@ def ga4_channel_report(
         order_bys=[{"metric": "sessions", "desc": True}],
     )
 
-    rows = sorted(report["rows"], key=lambda r: to_float(r.get("sessions")), reverse=True)
+    # The report is already ordered by sessions descending.
+    rows = report["rows"]
     return {
         "property_id": resolved_property,
         "start_date": resolved_start,
@@ -618,7 +764,7 @@ def ga4_channel_report(
 
 
 @mcp.tool()
-def analytics_merge_page_metrics(
+async def analytics_merge_page_metrics(
     site_url: str | None = None,
     property_id: str | None = None,
     start_date: str | None = None,
@@ -627,7 +773,8 @@ def analytics_merge_page_metrics(
     max_rows: int = 50000,
 ) -> dict[str, Any]:
     """Merge normalized GSC + GA4 page metrics into one dataset."""
-    data = _fetch_page_data(
+    data = await asyncio.to_thread(
+        _fetch_page_data,
         site_url,
         property_id,
         start_date,
@@ -653,7 +800,7 @@ def analytics_merge_page_metrics(
 
 
 @mcp.tool()
-def analytics_generate_action_items(
+async def analytics_generate_action_items(
     site_url: str | None = None,
     property_id: str | None = None,
     start_date: str | None = None,
@@ -665,7 +812,8 @@ def analytics_generate_action_items(
 ) -> dict[str, Any]:
     """Generate prioritized SEO and content action items from merged data."""
     settings = _get_settings()
-    data = _fetch_page_data(
+    data = await asyncio.to_thread(
+        _fetch_page_data,
         site_url,
         property_id,
         start_date,
@@ -674,14 +822,20 @@ def analytics_generate_action_items(
         max_rows=max_rows,
     )
 
-    items = generate_action_items(data["merged_pages"], settings, max_items=max_items)
+    items = await asyncio.to_thread(
+        generate_action_items,
+        data["merged_pages"],
+        settings,
+        max_items=max_items,
+    )
 
     if priorities:
         allowed = {p.lower().strip() for p in priorities}
         items = [i for i in items if str(i.get("priority", "")).lower() in allowed]
 
-    priority_counts = Counter(item["priority"] for item in items)
-    category_counts = Counter(item["category"] for item in items)
+    priority_counts = Counter(map(itemgetter("priority"), items))
+    category_counts = Counter(map(itemgetter("category"), items))
+    portfolio = summarize_portfolio(data["merged_pages"])
 
     return {
         "ranges": data["ranges"],
@@ -691,14 +845,14 @@ def analytics_generate_action_items(
             "total_items": len(items),
             "priority_counts": dict(priority_counts),
             "category_counts": dict(category_counts),
-            "portfolio": summarize_portfolio(data["merged_pages"]),
+            "portfolio": portfolio,
         },
         "items": items,
     }
 
 
 @mcp.tool()
-def analytics_popularity_snapshot(
+async def analytics_popularity_snapshot(
     site_url: str | None = None,
     property_id: str | None = None,
     start_date: str | None = None,
@@ -707,7 +861,8 @@ def analytics_popularity_snapshot(
     max_rows: int = 50000,
 ) -> dict[str, Any]:
     """Get top pages by clicks, impressions, sessions, and conversions."""
-    data = _fetch_page_data(
+    data = await asyncio.to_thread(
+        _fetch_page_data,
         site_url,
         property_id,
         start_date,
@@ -715,17 +870,22 @@ def analytics_popularity_snapshot(
         include_previous_period=False,
         max_rows=max_rows,
     )
+    snapshot = await asyncio.to_thread(
+        build_popularity_snapshot,
+        data["merged_pages"],
+        top_n=max(1, top_n),
+    )
 
     return {
         "ranges": data["ranges"],
         "site_url": data["site_url"],
         "property_id": data["property_id"],
-        "snapshot": build_popularity_snapshot(data["merged_pages"], top_n=max(1, top_n)),
+        "snapshot": snapshot,
     }
 
 
 @mcp.tool()
-def analytics_trend_report(
+async def analytics_trend_report(
     site_url: str | None = None,
     property_id: str | None = None,
     start_date: str | None = None,
@@ -734,7 +894,8 @@ def analytics_trend_report(
     max_rows: int = 50000,
 ) -> dict[str, Any]:
     """Compare current vs previous period to surface gainers and decliners."""
-    data = _fetch_page_data(
+    data = await asyncio.to_thread(
+        _fetch_page_data,
         site_url,
         property_id,
         start_date,
@@ -742,17 +903,22 @@ def analytics_trend_report(
         include_previous_period=True,
         max_rows=max_rows,
     )
+    trends = await asyncio.to_thread(
+        build_trend_report,
+        data["merged_pages"],
+        top_n=max(1, top_n),
+    )
 
     return {
         "ranges": data["ranges"],
         "site_url": data["site_url"],
         "property_id": data["property_id"],
-        "trends": build_trend_report(data["merged_pages"], top_n=max(1, top_n)),
+        "trends": trends,
     }
 
 
 @mcp.tool()
-def analytics_data_quality_report(
+async def analytics_data_quality_report(
     site_url: str | None = None,
     property_id: str | None = None,
     start_date: str | None = None,
@@ -761,7 +927,8 @@ def analytics_data_quality_report(
     top_n_unmatched: int = 20,
 ) -> dict[str, Any]:
     """Show merge coverage and top URL mismatches between GSC and GA4."""
-    data = _fetch_page_data(
+    data = await asyncio.to_thread(
+        _fetch_page_data,
         site_url,
         property_id,
         start_date,
@@ -769,34 +936,35 @@ def analytics_data_quality_report(
         include_previous_period=False,
         max_rows=max_rows,
     )
+    quality = await asyncio.to_thread(
+        build_data_quality_report,
+        data["merged_pages"],
+        top_n_unmatched=max(1, top_n_unmatched),
+    )
     return {
         "ranges": data["ranges"],
         "site_url": data["site_url"],
         "property_id": data["property_id"],
-        "quality": build_data_quality_report(
-            data["merged_pages"],
-            top_n_unmatched=max(1, top_n_unmatched),
-        ),
+        "quality": quality,
     }
 
 
-@mcp.tool()
-def analytics_query_page_opportunities(
-    site_url: str | None = None,
-    property_id: str | None = None,
-    start_date: str | None = None,
-    end_date: str | None = None,
-    min_impressions: int = 100,
-    top_n: int = 50,
-    max_rows: int = 100000,
+def _query_page_opportunities(
+    site_url: str | None,
+    property_id: str | None,
+    start_date: str | None,
+    end_date: str | None,
+    min_impressions: int,
+    top_n: int,
+    max_rows: int,
 ) -> dict[str, Any]:
-    """Find high-impression query/page pairs with weak CTR and weak on-page outcomes."""
     settings = _get_settings()
     connector = _get_gsc_connector()
     resolved_site = _resolve_site_url(site_url)
     resolved_start, resolved_end = _default_dates(start_date, end_date)
 
-    pairs_resp = connector.search_analytics_all(
+    pairs_resp = _cached_report(
+        connector.search_analytics_all,
         resolved_site,
         resolved_start,
         resolved_end,
@@ -809,59 +977,64 @@ def analytics_query_page_opportunities(
     resolved_property = property_id or settings.default_ga4_property_id
     if settings.enable_ga4 and resolved_property:
         ga4 = _get_ga4_connector()
-        ga4_resp = ga4.run_report_all(
+        ga4_pages = _ga4_pages(
+            ga4,
             _resolve_property_id(resolved_property),
             resolved_start,
             resolved_end,
-            dimensions=["landingPagePlusQueryString"],
-            metrics=["sessions", "engagedSessions", "conversions"],
-            order_bys=[{"metric": "sessions", "desc": True}],
             max_rows=max_rows,
         )
-        ga4_pages = normalize_ga4_rows_by_page(
-            ga4_resp["rows"],
-            base_url=settings.canonical_base_url,
-        )
-
-    opportunities: list[dict[str, Any]] = []
 
-    for row in pairs_resp["rows"]:
-        keys = row.get("keys", [])
-        if len(keys) < 2:
-            continue
-
-        query = str(keys[0])
-        page = str(keys[1])
-        normalized_page = normalize_url(page, base_url=settings.canonical_base_url)
-
-        impressions = to_float(row.get("impressions"))
-        clicks = to_float(row.get("clicks"))
-        ctr = to_float(row.get("ctr"))
-        position = to_float(row.get("position"))
-
-        if impressions < min_impressions:
-            continue
-        if ctr >= settings.target_ctr:
-            continue
-
-        ga4_data = ga4_pages.get(normalized_page) or ga4_pages.get(page)
-        sessions = to_float((ga4_data or {}).get("ga4_sessions"))
-        conversion_rate = to_float((ga4_data or {}).get("ga4_conversion_rate"))
-
-        ctr_gap = max(0.0, settings.target_ctr - ctr) / max(settings.target_ctr, 1e-6)
-        opp_score = min(100.0, ctr_gap * 60 + (impressions / 1000) * 4)
-        if sessions > 0 and conversion_rate < settings.target_conversion_rate:
-            opp_score += 15
+    page_outcomes: dict[str, tuple[float, float]] = {}
+
+    target_ctr = settings.target_ctr
+    target_conversion_rate = settings.target_conversion_rate
+    base_url = settings.canonical_base_url
+
+    def candidates() -> Iterator[tuple[tuple[float], tuple[Any, ...]]]:
+        for row in pairs_resp["rows"]:
+            keys = row.get("keys", [])
+            if len(keys) < 2:
+                continue
+
+            _, impressions, ctr, _ = gsc_row_metrics(row)
+            if impressions < min_impressions:
+                continue
+            if ctr >= target_ctr:
+                continue
+
+            page = str(keys[1])
+            outcomes = page_outcomes.get(page)
+            if outcomes is None:
+                normalized_page = normalize_url(page, base_url=base_url)
+                ga4_data = ga4_pages.get(normalized_page) or ga4_pages.get(page) or {}
+                outcomes = page_outcomes[page] = (
+                    to_float(ga4_data.get("ga4_sessions")),
+                    to_float(ga4_data.get("ga4_conversion_rate")),
+                )
+            sessions, conversion_rate = outcomes
+
+            ctr_gap = max(0.0, target_ctr - ctr) / max(target_ctr, 1e-6)
+            opp_score = min(100.0, ctr_gap * 60 + (impressions / 1000) * 4)
+            if sessions > 0 and conversion_rate < target_conversion_rate:
+                opp_score += 15
+
+            score = round(opp_score, 2)
+            yield (score,), (row, page, score, impressions, ctr, sessions, conversion_rate)
+
+    top_candidates, total_opportunities = top_ranked(candidates(), max(1, top_n))
 
+    opportunities: list[dict[str, Any]] = []
+    for row, page, score, impressions, ctr, sessions, conversion_rate in top_candidates:
         opportunities.append(
             {
-                "query": query,
+                "query": str(row["keys"][0]),
                 "page": page,
-                "score": round(opp_score, 2),
-                "clicks": round(clicks, 2),
+                "score": score,
+                "clicks": round(to_float(row.get("clicks")), 2),
                 "impressions": round(impressions, 2),
                 "ctr": round(ctr, 4),
-                "position": round(position, 2),
+                "position": round(to_float(row.get("position")), 2),
                 "ga4_sessions": round(sessions, 2),
                 "ga4_conversion_rate": round(conversion_rate, 4),
                 "recommended_actions": [
@@ -872,33 +1045,55 @@ def analytics_query_page_opportunities(
             }
         )
 
-    opportunities.sort(key=lambda x: x["score"], reverse=True)
-
     return {
         "site_url": resolved_site,
         "property_id": resolved_property,
         "start_date": resolved_start,
         "end_date": resolved_end,
-        "total_opportunities": len(opportunities),
-        "opportunities": opportunities[: max(1, top_n)],
+        "total_opportunities": total_opportunities,
+        "opportunities": opportunities,
     }
 
 
 @mcp.tool()
-def analytics_topic_clusters(
+async def analytics_query_page_opportunities(
     site_url: str | None = None,
+    property_id: str | None = None,
     start_date: str | None = None,
     end_date: str | None = None,
-    min_query_impressions: int = 50,
-    top_n_topics: int = 30,
+    min_impressions: int = 100,
+    top_n: int = 50,
     max_rows: int = 100000,
 ) -> dict[str, Any]:
-    """Extract high-impact query token clusters to guide content focus."""
+    """Find high-impression query/page pairs with weak CTR and weak on-page outcomes."""
+    return await asyncio.to_thread(
+        _query_page_opportunities,
+        site_url,
+        property_id,
+        start_date,
+        end_date,
+        min_impressions,
+        top_n,
+        max_rows,
+    )
+
+
+def _topic_clusters(
+    site_url: str | None,
+    start_date: str | None,
+    end_date: str | None,
+    min_query_impressions: int,
+    top_n_topics: int,
+    max_rows: int,
+    columnar: bool,
+    include_query_count: bool,
+) -> dict[str, Any]:
     connector = _get_gsc_connector()
     resolved_site = _resolve_site_url(site_url)
     resolved_start, resolved_end = _default_dates(start_date, end_date)
 
-    response = connector.search_analytics_all(
+    response = _cached_report(
+        connector.search_analytics_all,
         resolved_site,
         resolved_start,
         resolved_end,
@@ -907,27 +1102,12 @@ def analytics_topic_clusters(
         max_rows=max_rows,
     )
 
-    token_stats: dict[str, dict[str, float]] = {}
-    stop_words = {
-        "the",
-        "a",
-        "an",
-        "to",
-        "of",
-        "for",
-        "in",
-        "on",
-        "with",
-        "and",
-        "or",
-        "is",
-        "are",
-        "what",
-        "how",
-        "why",
-        "when",
-    }
-
+    # Search Analytics ctr is clicks / impressions, so a token's weighted ctr is its
+    # click total over its impression total.
+    token_ids: dict[str, int] = {}
+    query_counts: list[int] = []
+    token_impressions: list[float] = []
+    token_clicks: list[float] = []
     for row in response["rows"]:
         keys = row.get("keys", [])
         if not keys:
@@ -936,56 +1116,86 @@ def analytics_topic_clusters(
         if not query:
             continue
 
-        impressions = to_float(row.get("impressions"))
-        clicks = to_float(row.get("clicks"))
-        ctr = to_float(row.get("ctr"))
-
+        clicks, impressions, _, _ = gsc_row_metrics(row)
         if impressions < min_query_impressions:
             continue
 
-        tokens = [t for t in query.replace("-", " ").split() if len(t) >= 3]
-        tokens = [t for t in tokens if t not in stop_words]
-        unique_tokens = set(tokens)
-        for token in unique_tokens:
-            data = token_stats.setdefault(
-                token,
-                {
-                    "queries": 0.0,
-                    "impressions": 0.0,
-                    "clicks": 0.0,
-                    "ctr_weighted": 0.0,
-                },
-            )
-            data["queries"] += 1
-            data["impressions"] += impressions
-            data["clicks"] += clicks
-            data["ctr_weighted"] += ctr * impressions
-
-    topics: list[dict[str, Any]] = []
-    for token, stats in token_stats.items():
-        impressions = stats["impressions"]
-        weighted_ctr = stats["ctr_weighted"] / impressions if impressions > 0 else 0.0
-        topics.append(
-            {
-                "topic": token,
-                "query_count": int(stats["queries"]),
-                "impressions": round(impressions, 2),
-                "clicks": round(stats["clicks"], 2),
-                "ctr": round(weighted_ctr, 4),
-            }
-        )
+        for token in _topic_tokens(query):
+            i = token_ids.get(token)
+            if i is None:
+                token_ids[token] = len(query_counts)
+                query_counts.append(1)
+                token_impressions.append(impressions)
+                token_clicks.append(clicks)
+            else:
+                if include_query_count:
+                    query_counts[i] += 1
+                token_impressions[i] += impressions
+                token_clicks[i] += clicks
+
+    rounded_impressions = [round(value, 2) for value in token_impressions]
+    order = heapq.nlargest(
+        max(1, top_n_topics),
+        range(len(query_counts)),
+        key=(lambda i: (rounded_impressions[i], query_counts[i]))
+        if include_query_count
+        else rounded_impressions.__getitem__,
+    )
 
-    topics.sort(key=lambda t: (t["impressions"], t["query_count"]), reverse=True)
+    tokens = list(token_ids)
+    topic_ctrs: list[float] = []
+    for i in order:
+        impressions = token_impressions[i]
+        topic_ctrs.append(
+            round(token_clicks[i] / impressions, 4) if impressions > 0 else 0.0
+        )
+    columns: dict[str, list[Any]] = {"topic": [tokens[i] for i in order]}
+    if include_query_count:
+        columns["query_count"] = [query_counts[i] for i in order]
+    columns["impressions"] = [rounded_impressions[i] for i in order]
+    columns["clicks"] = [round(token_clicks[i], 2) for i in order]
+    columns["ctr"] = topic_ctrs
+
+    topics: list[dict[str, Any]] | dict[str, Any]
+    if columnar:
+        topics = {"columns": list(columns), "data": columns}
+    else:
+        topics = [dict(zip(columns, values)) for values in zip(*columns.values())]
 
     return {
         "site_url": resolved_site,
         "start_date": resolved_start,
         "end_date": resolved_end,
-        "total_topics": len(topics),
-        "topics": topics[: max(1, top_n_topics)],
+        "total_topics": len(query_counts),
+        "topics": topics,
     }
 
 
+@mcp.tool()
+async def analytics_topic_clusters(
+    site_url: str | None = None,
+    start_date: str | None = None,
+    end_date: str | None = None,
+    min_query_impressions: int = 50,
+    top_n_topics: int = 30,
+    max_rows: int = 100000,
+    columnar: bool = False,
+    include_query_count: bool = True,
+) -> dict[str, Any]:
+    """Extract high-impact query token clusters to guide content focus."""
+    return await asyncio.to_thread(
+        _topic_clusters,
+        site_url,
+        start_date,
+        end_date,
+        min_query_impressions,
+        top_n_topics,
+        max_rows,
+        columnar,
+        include_query_count,
+    )
+
+
 def main() -> None:
     mcp.run()
 